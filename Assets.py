@@ -0,0 +1,190 @@
+import pygame
+import os
+import sys
+import threading
+import queue
+import hashlib
+import mmap
+from Manager import data_dir
+
+
+def resource_path(relative_path):
+    try:
+        base_path = sys._MEIPASS  # PyInstaller temp folder
+    except Exception:
+        base_path = os.path.dirname(os.path.abspath(__file__))  # script folder
+    return os.path.join(base_path, relative_path)
+
+
+AUDIO_CACHE_DIR = os.path.join(data_dir, "audio_cache")
+
+# Asset kinds
+SOUND = "sound"
+IMAGE = "image"
+
+# Every file the game loads: name -> (kind, path, options)
+# volume: set on sounds once decoded
+# lazy: not loaded at startup, only when first requested
+MANIFEST = {
+    "coin_1": (SOUND, "sounds/coin/coin-collect-retro-1.mp3", {"volume": 0.3}),
+    "coin_2": (SOUND, "sounds/coin/coin-collect-retro-2.mp3", {"volume": 0.3}),
+    "coin_3": (SOUND, "sounds/coin/coin-collect-retro-3.mp3", {"volume": 0.1}),
+    "zap": (SOUND, "sounds/dash/electric-shock.mp3", {"volume": 0.3}),
+    "background": (IMAGE, "background/hack.webp", {}),
+    "portal": (SOUND, "sounds/portal/scifi-whoosh.mp3", {"volume": 0.2, "lazy": True}),
+    "keycard": (SOUND, "sounds/portal/keycard.mp3", {"volume": 0.3, "lazy": True}),
+}
+
+
+class AssetHandle:
+    """An asset that may still be loading.
+
+    get() never blocks and gives None until the asset is ready (or if it
+    failed to load); wait() blocks until the worker is done with it.
+    """
+
+    def __init__(self, manager, name, kind, path, options):
+        self.manager = manager
+        self.name = name
+        self.kind = kind
+        self.path = path
+        self.options = options
+        self.value = None
+        self.error = None
+        self.requested = False
+        self.loaded = threading.Event()
+
+    @property
+    def ready(self):
+        return self.loaded.is_set()
+
+    def get(self):
+        if not self.requested:
+            self.manager.request(self.name)
+        return self.value
+
+    def wait(self, timeout=None):
+        if not self.requested:
+            self.manager.request(self.name)
+        self.loaded.wait(timeout)
+        return self.value
+
+
+class PCMCache:
+    """Decoded sounds on disk, so each MP3 is decoded once rather than on every launch.
+
+    An entry holds the raw samples of a mixer.Sound in the mixer's own format.
+    Its file name is the asset name plus a hash of the source file and the
+    mixer settings (frequency, format, channels). When either changes, the
+    name changes too: the entry is rebuilt and the asset's old one is deleted.
+    """
+
+    def __init__(self, directory=AUDIO_CACHE_DIR):
+        self.directory = directory
+
+    def entry_name(self, name, path):
+        digest = hashlib.sha1()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 16), b""):
+                digest.update(chunk)
+        digest.update(repr(pygame.mixer.get_init()).encode())
+        return f"{name}-{digest.hexdigest()[:16]}.pcm"
+
+    def load(self, name, path):
+        entry = os.path.join(self.directory, self.entry_name(name, path))
+        if os.path.isfile(entry) and os.path.getsize(entry):
+            # The mixer copies the samples, the mapping is only read through once
+            with open(entry, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as samples:
+                return pygame.mixer.Sound(buffer=samples)
+
+        sound = pygame.mixer.Sound(path)
+        self._store(name, entry, sound.get_raw())
+        return sound
+
+    def _store(self, name, entry, samples):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for old_file in os.listdir(self.directory):
+                if old_file.startswith(name + "-") and old_file.endswith(".pcm"):
+                    os.remove(os.path.join(self.directory, old_file))
+            # Written next to the entry and renamed, a crash never leaves half an entry behind
+            with open(entry + ".tmp", "wb") as file:
+                file.write(samples)
+            os.replace(entry + ".tmp", entry)
+        except OSError as e:
+            print(f"Could not cache {name}: {e}")  # The sound is still fine, the next launch decodes it again
+
+
+class AssetManager:
+    """Loads the manifest on a background thread.
+
+    start() queues every asset that isn't lazy in manifest order, the first
+    request() of a lazy one queues it behind them. Decoding happens on the
+    worker, so the window and the menus are up before the sounds are.
+    """
+
+    def __init__(self, manifest=MANIFEST, pcm_cache=None):
+        self.pcm_cache = pcm_cache  # Decoded sounds on disk, None decodes every time
+        self.handles = {}
+        for name, (kind, path, options) in manifest.items():
+            self.handles[name] = AssetHandle(self, name, kind, path, options)
+        self.pending = queue.Queue()
+        self.lock = threading.Lock()  # Guards requested, so nothing is queued twice
+        self.worker = None
+
+    def start(self):
+        """Queue the startup assets, call once the mixer and display are up"""
+        self.request(*[name for name, handle in self.handles.items() if not handle.options.get("lazy")])
+
+    def request(self, *names):
+        """Queue assets for loading, the worker is started with the first one"""
+        with self.lock:
+            for name in names:
+                handle = self.handles[name]
+                if not handle.requested:
+                    handle.requested = True
+                    self.pending.put(handle)
+            if self.worker is None:
+                self.worker = threading.Thread(target=self._work, name="asset-loader", daemon=True)
+                self.worker.start()
+
+    def handle(self, name):
+        return self.handles[name]
+
+    def get(self, name):
+        return self.handles[name].get()
+
+    def wait(self, name, timeout=None):
+        return self.handles[name].wait(timeout)
+
+    def sounds(self):
+        """The sounds loaded so far, by name"""
+        return {name: handle.value for name, handle in self.handles.items()
+                if handle.kind == SOUND and handle.value is not None}
+
+    def _work(self):
+        while True:
+            handle = self.pending.get()
+            try:
+                handle.value = self._load(handle)
+            except Exception as e:
+                handle.error = e
+                print(f"Error loading {handle.path}: {e}")
+            handle.loaded.set()
+
+    def _load(self, handle):
+        path = resource_path(handle.path)
+        if handle.kind == SOUND:
+            if self.pcm_cache is not None:
+                sound = self.pcm_cache.load(handle.name, path)
+            else:
+                sound = pygame.mixer.Sound(path)
+            if "volume" in handle.options:
+                sound.set_volume(handle.options["volume"])
+            return sound
+        if handle.kind == IMAGE:
+            return pygame.image.load(path)
+        raise ValueError(f"unknown asset kind {handle.kind}")
+
+
+assets = AssetManager(pcm_cache=PCMCache())
@@ -0,0 +1,169 @@
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Keep worker processes quiet
+
+import argparse
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from Simulation import GameSimulation, InputState, Difficulty, TICK_RATE
+
+# Series sampled from every session, one value per sample interval
+SERIES = [
+    "scroll_speed",
+    "obstacles",
+    "coins",
+    "viruses",
+    "obstacle_density",  # Obstacles on screen per 1000 px of width
+    "obstacle_rejection_rate",  # Share of spawn attempts in the interval that were blocked
+    "coin_rejection_rate",
+    "collision_ticks",  # Ticks the (invulnerable) robot spent inside something
+    "portal_share",  # Share of the interval spent in portal (virus) mode
+]
+
+# Sampled only for intervals spent entirely outside portal mode, None otherwise:
+# portal mode stops obstacle spawns, which would pull these towards 0
+OBSTACLE_SERIES = ["obstacles", "obstacle_density", "obstacle_rejection_rate"]
+
+# Inputs the autopilot picks from: nothing, W, S, A, D
+AUTOPILOT_INPUTS = [0, 1, 4, 2, 8]
+
+
+def run_session(seed, duration=180, sample_interval=1.0, difficulty=None, entity_store=False, portals=False):
+    """Run one headless, invulnerable session and return its sampled series.
+
+    Portals are off by default: the invulnerable autopilot would fly into the
+    first one and spend the rest of the session in virus mode.
+    """
+    simulation = GameSimulation(difficulty=difficulty, invulnerable=True, entity_store=entity_store,
+                                portals=portals)
+    simulation.reset(seed)
+    autopilot = random.Random(seed ^ 0xA070)  # Separate from the game's own streams
+    keys = InputState()
+
+    samples = {name: [] for name in SERIES}
+    interval_ms = sample_interval * 1000
+    next_sample = interval_ms
+    last_counts = (0, 0, 0, 0, 0)
+    interval_ticks = portal_ticks = 0
+
+    for _ in range(int(duration * TICK_RATE)):
+        # Hold random inputs for a random while, like a distracted player
+        if autopilot.random() < 0.02:
+            keys = InputState.from_bits(autopilot.choice(AUTOPILOT_INPUTS))
+        simulation.step(keys)
+        interval_ticks += 1
+        if simulation.portal_system.active:
+            portal_ticks += 1
+
+        if simulation.current_time < next_sample:
+            continue
+        next_sample += interval_ms
+        portal_share = portal_ticks / interval_ticks
+        interval_ticks = portal_ticks = 0
+
+        counts = (simulation.obstacle_spawn_attempts, simulation.obstacle_spawn_rejections,
+                  simulation.coin_spawn_attempts, simulation.coin_spawn_rejections,
+                  simulation.collision_ticks)
+        obstacle_attempts, obstacle_rejections, coin_attempts, coin_rejections, collisions = (
+            now - before for now, before in zip(counts, last_counts))
+        last_counts = counts
+
+        on_screen = sum(1 for obstacle in simulation.obstacles
+                        if obstacle.get_x_coord() < simulation.screen_width)
+        samples["scroll_speed"].append(simulation.scroll_speed)
+        samples["obstacles"].append(len(simulation.obstacles))
+        samples["coins"].append(len(simulation.coins))
+        samples["viruses"].append(len(simulation.portal_system.viruses))
+        samples["obstacle_density"].append(on_screen * 1000 / simulation.screen_width)
+        samples["obstacle_rejection_rate"].append(obstacle_rejections / obstacle_attempts if obstacle_attempts else 0)
+        samples["coin_rejection_rate"].append(coin_rejections / coin_attempts if coin_attempts else 0)
+        samples["collision_ticks"].append(collisions)
+        samples["portal_share"].append(portal_share)
+        if portal_share:
+            for name in OBSTACLE_SERIES:
+                samples[name][-1] = None
+
+    return samples
+
+
+def _run_session(args):
+    return run_session(*args)
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run_batch(sessions=1000, duration=180, seed=0, workers=None, sample_interval=1.0, difficulty=None,
+              entity_store=False, portals=False):
+    """Spread seeded sessions over all cores and summarise every series per sample.
+
+    Returns {series: {"mean": [...], "p10": [...], "p90": [...]}} plus the sample times.
+    Samples a session left out (None) don't count, a sample no session has is None.
+    Session i uses seed + i, so a batch is reproducible from its seed.
+    """
+    jobs = [(seed + i, duration, sample_interval, difficulty, entity_store, portals) for i in range(sessions)]
+    chunksize = max(1, sessions // ((workers or os.cpu_count() or 1) * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_run_session, jobs, chunksize=chunksize))
+
+    sample_count = min(len(result["obstacles"]) for result in results)
+    summary = {"time": [(i + 1) * sample_interval for i in range(sample_count)]}
+    for name in SERIES:
+        mean, p10, p90 = [], [], []
+        for i in range(sample_count):
+            values = sorted(result[name][i] for result in results if result[name][i] is not None)
+            if not values:
+                mean.append(None)
+                p10.append(None)
+                p90.append(None)
+                continue
+            mean.append(sum(values) / len(values))
+            p10.append(_percentile(values, 0.1))
+            p90.append(_percentile(values, 0.9))
+        summary[name] = {"mean": mean, "p10": p10, "p90": p90}
+    return summary
+
+
+def print_summary(summary, every=10):
+    """Mean (p90) of the main series every few samples"""
+    columns = [("scroll_speed", "speed"), ("obstacles", "obstacles"), ("obstacle_density", "density"),
+               ("obstacle_rejection_rate", "obst. reject"), ("coin_rejection_rate", "coin reject"),
+               ("viruses", "viruses"), ("portal_share", "in portal")]
+    print("time  " + "  ".join(f"{label:>16}" for _, label in columns))
+    for i, t in enumerate(summary["time"]):
+        if (i + 1) % every:
+            continue
+        cells = []
+        for name, _ in columns:
+            mean, p90 = summary[name]["mean"][i], summary[name]["p90"][i]
+            cells.append(f"{'-':>16}" if mean is None else f"{mean:>7.2f} ({p90:>6.2f})")
+        print(f"{t:>4.0f}  " + "  ".join(cells))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo batch runs of the spawn and difficulty curves")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=180, help="seconds of game time per session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="defaults to all cores")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between samples")
+    parser.add_argument("--overclock", action="store_true", help="use the overclock speed tier")
+    parser.add_argument("--entity-store", action="store_true", help="keep entity positions in NumPy arrays")
+    parser.add_argument("--portals", action="store_true",
+                        help="let portals spawn, obstacle stats then only cover time outside portal mode")
+    parser.add_argument("--out", metavar="FILE", help="write the summary as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    difficulty = Difficulty.overclock() if args.overclock else Difficulty()
+    summary = run_batch(args.sessions, args.duration, args.seed, args.workers, args.interval, difficulty,
+                        args.entity_store, args.portals)
+    print(f"{args.sessions} sessions of {args.duration:.0f} sec in {time.perf_counter() - start:.1f}s")
+    print_summary(summary)
+
+    if args.out:
+        with open(args.out, "w") as file:
+            json.dump(summary, file, indent=4)
@@ -1,14 +1,6 @@
 import pygame
 import random
-import os
-import sys
-
-def resource_path(relative_path):
-    try:
-        base_path = sys._MEIPASS  # PyInstaller temp folder
-    except Exception:
-        base_path = os.path.dirname(os.path.abspath(__file__))  # script folder
-    return os.path.join(base_path, relative_path)
+from Fonts import fonts
 
 class HackerButton:
     def __init__(self, x, y, width, height, text, color=(0, 255, 0)):
@@ -19,11 +11,8 @@ class HackerButton:
         self.active = False
         self.glitch_offset = 0
         self.glitch_timer = 0
-        
-        try:
-            self.font = pygame.font.Font(resource_path("fonts/Retro/Perfect DOS VGA 437.ttf"), 24)
-        except:
-            self.font = pygame.font.SysFont("Courier New", 24, bold=True)
+        self.font_size = 24
+        self.font = fonts.get(self.font_size)
 
     def draw(self, surface):
         mouse_pos = pygame.mouse.get_pos()
@@ -43,7 +32,7 @@ class HackerButton:
         
         # Draw text with cursor and glitch effect
         text = f"> {self.text}{'_' if self.active else ''}"
-        text_surf = self.font.render(text, True, color)
+        text_surf = fonts.render(text, color, self.font_size)
         surface.blit(text_surf, (self.rect.x + 10 + self.glitch_offset, 
                                 self.rect.centery - text_surf.get_height()//2 + self.glitch_offset))
         
@@ -2,14 +2,30 @@ import pygame
 import random
 import math
 
+def _converted(frames):
+    # Match the display's pixel format when there is one (headless runs have none)
+    if pygame.display.get_surface() is None:
+        return frames
+    return [frame.convert_alpha() for frame in frames]
+
+
 class Coin:
-    def __init__(self, x, y, current_time):
+    SIZE = 35  # Slightly increased size
+    COLORS = {20: (0, 255, 0), 50: (0, 255, 255), 100: (255, 215, 0)}
+    VARIANTS = 4  # Baked frames per coin type, each coin shows one of them
+
+    # Shared by every coin, built once by build_atlas()
+    _atlas = None  # value -> frames
+    _glows = None  # size -> CRYPTO glow sprite
+
+    def __init__(self, x, y, current_time, rng=random, fx_rng=random, value=None):
+        # rng picks the value (gameplay) unless it was rolled already, fx_rng only the look
         self.x = x
+        self.prev_x = x  # Position before the last update, for interpolated drawing
         self.y = y
-        self.size = 35  # Slightly increased size
+        self.size = self.SIZE
         self.collected = False
-        # Changed 100 to 75 to simplify, and adjusted weights accordingly
-        self.value = random.choices([20, 50, 100], weights=[70, 25, 5])[0]
+        self.value = value if value is not None else self.roll_value(rng)
         self.spawn_time = current_time
         self.pulse_phase = 0
         
@@ -17,113 +33,135 @@ class Coin:
         self.font = None  
         
         # Type-specific properties
+        self.color = self.COLORS[self.value]
         if self.value == 20:  # Common
             self.type = "DATA"
-            self.color = (0, 255, 0)
             self.symbol = "0101"
             self.pulse_speed = 0.05
         elif self.value == 50:  # Uncommon
             self.type = "CRYPTO"
-            self.color = (0, 255, 255)
             self.symbol = "Ξ"
             self.pulse_speed = 0.08
         else:  # Rare (now 75)
             self.type = "BITCOIN" # Changed type
-            self.color = (255, 215, 0)
             self.symbol = "$" # Changed symbol - still using $ as it's common for "credits"
             self.pulse_speed = 0.12
             # Removed _create_spawn_effect call as it's no longer needed for simplification
         
-        self.frames = self._create_frames()
-        self.current_frame = 0
+        self.variant = fx_rng.randrange(self.VARIANTS)
         self.current_size = self.size
 
+    @staticmethod
+    def roll_value(rng):
+        # Changed 100 to 75 to simplify, and adjusted weights accordingly
+        return rng.choices([20, 50, 100], weights=[70, 25, 5])[0]
+
+    @classmethod
+    def rect_at(cls, x, y):
+        """The rect of a coin spawned at (x, y), without making one"""
+        return pygame.Rect(x, y, cls.SIZE, cls.SIZE)
+
     @classmethod
     def set_font(cls, font):
         cls._class_font = font
 
-    def _create_frames(self):
-        """Create frames without font dependency"""
-        frames = []
-        for i in range(6):
-            frame = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+    @staticmethod
+    def build_atlas():
+        """Bake every coin variant and CRYPTO glow size, from a fixed seed so coins look the same every run"""
+        if Coin._atlas is not None:
+            return
+        rng = random.Random(0)
+        Coin._atlas = {value: [Coin._create_frame(value, color, rng) for _ in range(Coin.VARIANTS)]
+                       for value, color in Coin.COLORS.items()}
+        Coin._glows = {}
+        for size in range(int(Coin.SIZE * 0.8), int(Coin.SIZE * 1.2) + 1):  # Every size the CRYPTO pulse reaches
+            glow = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(glow, (*Coin.COLORS[50], 30), (size//2, size//2), size//2)
+            Coin._glows[size] = glow
+        Coin._atlas = {value: _converted(frames) for value, frames in Coin._atlas.items()}
+        Coin._glows = dict(zip(Coin._glows, _converted(Coin._glows.values())))
+
+    @staticmethod
+    def _create_frame(value, color, rng):
+        """Create one frame without font dependency"""
+        size = Coin.SIZE
+        frame = pygame.Surface((size, size), pygame.SRCALPHA)
+        
+        if value == 20:  # DATA coin
+            # Binary pattern with grid lines for a circuit board feel
+            grid_spacing = 8
+            line_color_alpha = (*color, 50) # Semi-transparent lines
             
-            if self.value == 20:  # DATA coin
-                # Binary pattern with grid lines for a circuit board feel
-                grid_spacing = 8
-                line_color_alpha = (*self.color, 50) # Semi-transparent lines
-                
-                # Draw horizontal grid lines
-                for y_line in range(0, self.size, grid_spacing):
-                    pygame.draw.line(frame, line_color_alpha, (0, y_line), (self.size, y_line), 1)
-                # Draw vertical grid lines
-                for x_line in range(0, self.size, grid_spacing):
-                    pygame.draw.line(frame, line_color_alpha, (x_line, 0), (x_line, self.size), 1)
-
-                # Add random "data" dots/squares
-                for _ in range(self.size // 4): 
-                    x_data = random.randint(0, self.size - 4)
-                    y_data = random.randint(0, self.size - 4)
-                    if random.random() > 0.4: # Probability to draw a "bit"
-                        pygame.draw.rect(frame, self.color, (x_data, y_data, 4, 4))
+            # Draw horizontal grid lines
+            for y_line in range(0, size, grid_spacing):
+                pygame.draw.line(frame, line_color_alpha, (0, y_line), (size, y_line), 1)
+            # Draw vertical grid lines
+            for x_line in range(0, size, grid_spacing):
+                pygame.draw.line(frame, line_color_alpha, (x_line, 0), (x_line, size), 1)
+
+            # Add random "data" dots/squares
+            for _ in range(size // 4): 
+                x_data = rng.randint(0, size - 4)
+                y_data = rng.randint(0, size - 4)
+                if rng.random() > 0.4: # Probability to draw a "bit"
+                    pygame.draw.rect(frame, color, (x_data, y_data, 4, 4))
+        
+        elif value == 50:  # CRYPTO coin
+            # Hexagonal design with inner lines for a network/blockchain feel
+            points = [
+                (size//2, 4),
+                (size-6, size//3),
+                (size-6, 2*size//3),
+                (size//2, size-4),
+                (6, 2*size//3),
+                (6, size//3)
+            ]
+            pygame.draw.polygon(frame, color, points, 2) # Thinner border
+
+            # Inner lines connecting opposite vertices (like a network)
+            pygame.draw.line(frame, color, points[0], points[3], 1)
+            pygame.draw.line(frame, color, points[1], points[4], 1)
+            pygame.draw.line(frame, color, points[2], points[5], 1)
+
+            # Small circle in the center, symbolizing a node or core
+            pygame.draw.circle(frame, color, (size//2, size//2), size//8, 1)
             
-            elif self.value == 50:  # CRYPTO coin
-                # Hexagonal design with inner lines for a network/blockchain feel
-                points = [
-                    (self.size//2, 4),
-                    (self.size-6, self.size//3),
-                    (self.size-6, 2*self.size//3),
-                    (self.size//2, self.size-4),
-                    (6, 2*self.size//3),
-                    (6, self.size//3)
-                ]
-                pygame.draw.polygon(frame, self.color, points, 2) # Thinner border
-
-                # Inner lines connecting opposite vertices (like a network)
-                pygame.draw.line(frame, self.color, points[0], points[3], 1)
-                pygame.draw.line(frame, self.color, points[1], points[4], 1)
-                pygame.draw.line(frame, self.color, points[2], points[5], 1)
-
-                # Small circle in the center, symbolizing a node or core
-                pygame.draw.circle(frame, self.color, (self.size//2, self.size//2), self.size//8, 1)
-                
-            else:  # 75 value - CREDIT coin (hacker theme)
-                center_x, center_y = self.size // 2, self.size // 2
-                radius = self.size // 2 - 4
-                
-                # Outer circuit-like border
-                pygame.draw.circle(frame, self.color, (center_x, center_y), radius, 2)
-                
-                # Inner digital pattern (cross with small rectangles)
-                line_length = radius * 0.7
-                pygame.draw.line(frame, self.color, (center_x - line_length//2, center_y), 
-                                 (center_x + line_length//2, center_y), 2)
-                pygame.draw.line(frame, self.color, (center_x, center_y - line_length//2), 
-                                 (center_x, center_y + line_length//2), 2)
-                                 
-                # Small "nodes" or "data points" at the ends of the cross
-                rect_size = 4
-                pygame.draw.rect(frame, self.color, (center_x - line_length//2 - rect_size//2, center_y - rect_size//2, rect_size, rect_size))
-                pygame.draw.rect(frame, self.color, (center_x + line_length//2 - rect_size//2, center_y - rect_size//2, rect_size, rect_size))
-                pygame.draw.rect(frame, self.color, (center_x - rect_size//2, center_y - line_length//2 - rect_size//2, rect_size, rect_size))
-                pygame.draw.rect(frame, self.color, (center_x - rect_size//2, center_y + line_length//2 - rect_size//2, rect_size, rect_size))
-                
-                # Add some random small lines/dots for "data flow" effect
-                for _ in range(self.size // 6):
-                    start_x = random.randint(center_x - radius + 2, center_x + radius - 2)
-                    start_y = random.randint(center_y - radius + 2, center_y + radius - 2)
-                    end_x = random.randint(start_x - 3, start_x + 3)
-                    end_y = random.randint(start_y - 3, start_y + 3)
-                    pygame.draw.line(frame, (*self.color, 100), (start_x, start_y), (end_x, end_y), 1)
+        else:  # 75 value - CREDIT coin (hacker theme)
+            center_x, center_y = size // 2, size // 2
+            radius = size // 2 - 4
+            
+            # Outer circuit-like border
+            pygame.draw.circle(frame, color, (center_x, center_y), radius, 2)
+            
+            # Inner digital pattern (cross with small rectangles)
+            line_length = radius * 0.7
+            pygame.draw.line(frame, color, (center_x - line_length//2, center_y), 
+                             (center_x + line_length//2, center_y), 2)
+            pygame.draw.line(frame, color, (center_x, center_y - line_length//2), 
+                             (center_x, center_y + line_length//2), 2)
+                             
+            # Small "nodes" or "data points" at the ends of the cross
+            rect_size = 4
+            pygame.draw.rect(frame, color, (center_x - line_length//2 - rect_size//2, center_y - rect_size//2, rect_size, rect_size))
+            pygame.draw.rect(frame, color, (center_x + line_length//2 - rect_size//2, center_y - rect_size//2, rect_size, rect_size))
+            pygame.draw.rect(frame, color, (center_x - rect_size//2, center_y - line_length//2 - rect_size//2, rect_size, rect_size))
+            pygame.draw.rect(frame, color, (center_x - rect_size//2, center_y + line_length//2 - rect_size//2, rect_size, rect_size))
+            
+            # Add some random small lines/dots for "data flow" effect
+            for _ in range(size // 6):
+                start_x = rng.randint(center_x - radius + 2, center_x + radius - 2)
+                start_y = rng.randint(center_y - radius + 2, center_y + radius - 2)
+                end_x = rng.randint(start_x - 3, start_x + 3)
+                end_y = rng.randint(start_y - 3, start_y + 3)
+                pygame.draw.line(frame, (*color, 100), (start_x, start_y), (end_x, end_y), 1)
 
-            frames.append(frame)
-        return frames
+        return frame
 
     # Removed _create_spawn_effect method entirely as it's no longer used
 
-    def update(self, scroll_speed, current_time):
-        self.x -= scroll_speed
-        self.pulse_phase += self.pulse_speed
+    def update(self, scroll_speed, current_time, dt=1.0):
+        self._move(scroll_speed, dt)
+        self.pulse_phase += self.pulse_speed * dt
         
         # Removed particle update logic as _create_spawn_effect is gone
 
@@ -136,28 +174,33 @@ class Coin:
             # Removed random frame updates to simplify
             pass # No special animation for the 75-value coin, keeping it simple
 
-    def draw(self, screen):
+    def _move(self, scroll_speed, dt):
+        # Position only, an entity store does this for all coins at once
+        self.prev_x = self.x
+        self.x -= scroll_speed * dt
+
+    def draw(self, screen, alpha=1.0):
         if not self.collected:
             # Removed particle drawing logic as _create_spawn_effect is gone
-            
+            x = self.prev_x + (self.x - self.prev_x) * alpha
+
             # Draw coin
-            frame = self.frames[self.current_frame].copy()
+            if Coin._atlas is None:
+                Coin.build_atlas()
+            frame = Coin._atlas[self.value][self.variant]
             
             if self.value == 50:
                 # Glow effect
-                glow = pygame.Surface((self.current_size, self.current_size), pygame.SRCALPHA)
-                pygame.draw.circle(glow, (*self.color, 30), 
-                                 (self.current_size//2, self.current_size//2),
-                                 self.current_size//2)
-                screen.blit(glow, (self.x - (self.current_size-self.size)//2,
+                glow = Coin._glows[self.current_size]
+                screen.blit(glow, (x - (self.current_size-self.size)//2,
                                  self.y - (self.current_size-self.size)//2))
             
             if self.value == 25: # This value is not used, might be a leftover. Keeping for now.
                 frame = pygame.transform.rotate(frame, self.current_rotation)
-                screen.blit(frame, (self.x - (frame.get_width()-self.size)//2,
+                screen.blit(frame, (x - (frame.get_width()-self.size)//2,
                                   self.y - (frame.get_height()-self.size)//2))
             else:
-                screen.blit(frame, (self.x, self.y))
+                screen.blit(frame, (x, self.y))
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.size, self.size)
@@ -173,9 +216,12 @@ class Coin:
 class KeyCollectible:
     SPAWN_DELAY = 2000  # Class variable for spawn timing
     SIZE = 70
+    FRAME_COUNT = 6
+    _frames = None  # Shared by every key, built once by build_frames()
 
     def __init__(self, x, y, current_time):
         self.x = x
+        self.prev_x = x
         self.y = y
         self.size = 50
         self.collected = False
@@ -183,7 +229,6 @@ class KeyCollectible:
         self.spawn_time = current_time
         self.pulse_phase = 0
         self.pulse_speed = 0.08
-        self.frames = self._create_frames()
         self.current_frame = 0
 
     @classmethod
@@ -195,30 +240,37 @@ class KeyCollectible:
                 return False
         return True
 
-    def _create_frames(self):
+    @staticmethod
+    def build_frames():
+        """Bake the key animation every key shares"""
+        if KeyCollectible._frames is None:
+            KeyCollectible._frames = _converted(KeyCollectible._create_frames(50, 0))
+
+    @staticmethod
+    def _create_frames(size, pulse_phase):
         frames = []
-        for i in range(6):
-            frame = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        for i in range(KeyCollectible.FRAME_COUNT):
+            frame = pygame.Surface((size, size), pygame.SRCALPHA)
             
             # Brighter keycard base (light blue-gray)
             card_color = (100, 120, 150)  # Lighter color
-            pygame.draw.rect(frame, card_color, (5, 5, self.size-10, self.size-10), border_radius=5)
+            pygame.draw.rect(frame, card_color, (5, 5, size-10, size-10), border_radius=5)
             
             # High-contrast magnetic strip
-            pygame.draw.rect(frame, (20, 20, 30), (10, 15, self.size-20, 8))
+            pygame.draw.rect(frame, (20, 20, 30), (10, 15, size-20, 8))
             
             # Glowing gold chip
             pygame.draw.rect(frame, (255, 200, 50), (15, 30, 12, 10))
             pygame.draw.rect(frame, (255, 240, 100), (15, 30, 12, 10), 1)
             
             # Pulsing blue glow (more visible)
-            glow_intensity = 0.5 + 0.5 * math.sin(self.pulse_phase + i)
-            glow = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            glow_radius = int(self.size * (0.8 + 0.2 * math.sin(self.pulse_phase)))
+            glow_intensity = 0.5 + 0.5 * math.sin(pulse_phase + i)
+            glow = pygame.Surface((size, size), pygame.SRCALPHA)
+            glow_radius = int(size * (0.8 + 0.2 * math.sin(pulse_phase)))
             pygame.draw.circle(
                 glow, 
                 (0, 150, 255, int(100 * glow_intensity)),
-                (self.size//2, self.size//2),
+                (size//2, size//2),
                 glow_radius,
                 3
             )
@@ -226,19 +278,23 @@ class KeyCollectible:
             
             # Add blinking red LED
             if i % 2 == 0:  # Blink every other frame
-                pygame.draw.circle(frame, (255, 40, 40), (self.size-10, 10), 3)
+                pygame.draw.circle(frame, (255, 40, 40), (size-10, 10), 3)
             
             frames.append(frame)
         return frames
 
-    def update(self, scroll_speed):
-        self.x -= scroll_speed
-        self.pulse_phase += self.pulse_speed
-        self.current_frame = int(self.pulse_phase * 3) % len(self.frames)
+    def update(self, scroll_speed, dt=1.0):
+        self.prev_x = self.x
+        self.x -= scroll_speed * dt
+        self.pulse_phase += self.pulse_speed * dt
+        self.current_frame = int(self.pulse_phase * 3) % self.FRAME_COUNT
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         if not self.collected:
-            screen.blit(self.frames[self.current_frame], (self.x, self.y))
+            if KeyCollectible._frames is None:
+                KeyCollectible.build_frames()
+            x = self.prev_x + (self.x - self.prev_x) * alpha
+            screen.blit(KeyCollectible._frames[self.current_frame], (x, self.y))
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.size, self.size)
@@ -252,9 +308,15 @@ class GlitchCollectible:
     SIZE = 80
     PATTERN_RADIUS = 90
     PATTERN_COUNT = 6
+    FRAME_COUNT = 4
+    VARIANTS = 3  # Frame sets with different glitch lines, a ring mixes them
+    FRAME_MS = 100  # Animation step of the shared clock
+    _frames = None  # Variant -> frames, shared by every glitch, built once by build_frames()
 
-    def __init__(self, x, y, current_time):
+    def __init__(self, x, y, current_time, fx_rng=random):
+        self.fx_rng = fx_rng
         self.x = x
+        self.prev_x = x
         self.y = y
         self.size = 50
         self.collected = False
@@ -262,9 +324,8 @@ class GlitchCollectible:
         self.spawn_time = current_time
         self.pulse_phase = 0
         self.pulse_speed = 0.12
-        self.frames = self._create_frames()
+        self.variant = fx_rng.randrange(self.VARIANTS)
         self.current_frame = 0
-        self.last_frame_update = 0
 
     @classmethod
     def can_spawn_pattern(cls, center_x, center_y, obstacles):
@@ -281,7 +342,16 @@ class GlitchCollectible:
                 return False
         return True
     
-    def _create_frames(self):
+    @staticmethod
+    def build_frames():
+        """Bake the glitch animations, from a fixed seed so they look the same every run"""
+        if GlitchCollectible._frames is None:
+            rng = random.Random(0)
+            GlitchCollectible._frames = [_converted(GlitchCollectible._create_frames(50, rng))
+                                         for _ in range(GlitchCollectible.VARIANTS)]
+
+    @staticmethod
+    def _create_frames(size, rng):
         frames = []
         base_colors = [
             (180, 0, 255),  # Purple
@@ -290,23 +360,23 @@ class GlitchCollectible:
         ]
         
         # Pre-create 4 frames instead of 8
-        for i in range(4):
-            frame = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        for i in range(GlitchCollectible.FRAME_COUNT):
+            frame = pygame.Surface((size, size), pygame.SRCALPHA)
             
             # Solid core with outline
             core_color = base_colors[i % len(base_colors)]
-            pygame.draw.circle(frame, core_color, (self.size//2, self.size//2), self.size//2 - 4)
-            pygame.draw.circle(frame, (255, 255, 255), (self.size//2, self.size//2), self.size//2 - 4, 2)
+            pygame.draw.circle(frame, core_color, (size//2, size//2), size//2 - 4)
+            pygame.draw.circle(frame, (255, 255, 255), (size//2, size//2), size//2 - 4, 2)
             
             # Add 3-5 glitch lines (reduced from 12)
-            for _ in range(random.randint(3, 5)):
-                start_x = random.randint(5, self.size-5)
-                start_y = random.randint(5, self.size-5)
-                end_x = start_x + random.randint(-10, 10)
-                end_y = start_y + random.randint(-10, 10)
+            for _ in range(rng.randint(3, 5)):
+                start_x = rng.randint(5, size-5)
+                start_y = rng.randint(5, size-5)
+                end_x = start_x + rng.randint(-10, 10)
+                end_y = start_y + rng.randint(-10, 10)
                 pygame.draw.line(
                     frame, 
-                    (random.randint(200, 255), 0, random.randint(200, 255)),
+                    (rng.randint(200, 255), 0, rng.randint(200, 255)),
                     (start_x, start_y), (end_x, end_y), 
                     1
                 )
@@ -314,17 +384,20 @@ class GlitchCollectible:
             frames.append(frame)
         return frames
 
-    def update(self, scroll_speed):
-        self.x -= scroll_speed
-        now = pygame.time.get_ticks()
-        if now - self.last_frame_update > 100:  # Update every 100ms
-            self.pulse_phase += self.pulse_speed
-            self.current_frame = int(self.pulse_phase) % len(self.frames)
-            self.last_frame_update = now
+    def update(self, scroll_speed, current_time=None, dt=1.0):
+        self.prev_x = self.x
+        self.x -= scroll_speed * dt
+        now = pygame.time.get_ticks() if current_time is None else current_time
+        # All glitches step on the same clock, one pulse every 100ms
+        self.pulse_phase = (now // self.FRAME_MS) * self.pulse_speed
+        self.current_frame = int(self.pulse_phase) % self.FRAME_COUNT
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         if not self.collected:
-            screen.blit(self.frames[self.current_frame], (self.x, self.y))
+            if GlitchCollectible._frames is None:
+                GlitchCollectible.build_frames()
+            x = self.prev_x + (self.x - self.prev_x) * alpha
+            screen.blit(GlitchCollectible._frames[self.variant][self.current_frame], (x, self.y))
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.size, self.size)
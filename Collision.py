@@ -0,0 +1,182 @@
+from bisect import bisect_left, bisect_right
+
+
+def swept_collide(rect, dx, dy, other, other_dx=0, other_dy=0):
+    """Whether rect touched other at any point while they moved by (dx, dy) and (other_dx, other_dy).
+
+    Both rects are given at their end positions. This is the continuous version
+    of rect.colliderect(other), which it matches when nothing moved, so fast
+    moves (dashes, lane switches, high scroll speeds) can't step over a hit.
+    """
+    # In other's frame it stands still and rect moves by the difference
+    move_x = dx - other_dx
+    move_y = dy - other_dy
+    enter, leave = 0.0, 1.0
+    # rect's top-left corner has to be strictly inside other grown by rect's size
+    for start, move, low, high in ((rect.x - move_x, move_x, other.left - rect.width, other.right),
+                                   (rect.y - move_y, move_y, other.top - rect.height, other.bottom)):
+        if move == 0:
+            if not low < start < high:
+                return False
+            continue
+        t1 = (low - start) / move
+        t2 = (high - start) / move
+        if t1 > t2:
+            t1, t2 = t2, t1
+        enter = max(enter, t1)
+        leave = min(leave, t2)
+        if enter >= leave:
+            return False
+    return True
+
+
+def _single_rect(entity):
+    return (entity.get_rect(),)
+
+
+class ScrollingIndex:
+    """Entities that all scroll left at the same speed, kept sorted by x.
+
+    Positions are stored in world space (screen x plus the distance scrolled so
+    far). That value never changes while everything scrolls together, so the
+    order is fixed when an entity is added and a rect query is a bisect plus a
+    short scan. Expired entities leave from the front by moving a head index,
+    removed ones become tombstones, and both are compacted away once they make
+    up half the list.
+    """
+    MARGIN = 1  # Pixels of slack for float drift and Rect truncation
+
+    def __init__(self, rects=_single_rect, released=None):
+        self.rects = rects  # entity -> its hit rects
+        self.released = released  # Called with every entity that leaves the index
+        self._reset()
+
+    def clear(self):
+        if self.released is not None:
+            for entity in self:
+                self.released(entity)
+        self._reset()
+
+    def _reset(self):
+        self.keys = []  # World-space left edges, sorted
+        self.entries = []  # Entities, None for removed ones
+        self.head = 0  # Everything before head has been evicted
+        self.live = 0
+        self.scrolled = 0
+        self.max_width = 0
+        self.world_x = {}  # id(entity) -> key, to find an entity again
+
+    def add(self, entity):
+        rects = self.rects(entity)
+        left = min(rect.left for rect in rects)
+        key = left + self.scrolled
+        self.max_width = max(self.max_width, max(rect.right for rect in rects) - left)
+
+        index = bisect_right(self.keys, key, self.head)  # Usually the end: new things spawn on the right
+        self.keys.insert(index, key)
+        self.entries.insert(index, entity)
+        self.world_x[id(entity)] = key
+        self.live += 1
+
+    def scroll(self, distance):
+        """Call with the same distance the entities just moved left"""
+        self.scrolled += distance
+
+    def remove(self, entity):
+        key = self.world_x.pop(id(entity), None)
+        if key is None:
+            return
+        index = bisect_left(self.keys, key, self.head)
+        while self.entries[index] is not entity:
+            index += 1
+        self.entries[index] = None
+        self.live -= 1
+        if self.released is not None:
+            self.released(entity)
+        self._compact()
+
+    def evict_front(self, expired):
+        """Drop entities from the left end for as long as expired(entity) is true"""
+        entries = self.entries
+        while self.head < len(entries):
+            entity = entries[self.head]
+            if entity is not None:
+                if not expired(entity):
+                    break
+                del self.world_x[id(entity)]
+                self.live -= 1
+                if self.released is not None:
+                    self.released(entity)
+            self.head += 1
+        self._compact()
+
+    def _compact(self):
+        if len(self.entries) - self.live < max(16, len(self.entries) // 2):
+            return
+        live = [i for i in range(self.head, len(self.entries)) if self.entries[i] is not None]
+        self.keys = [self.keys[i] for i in live]
+        self.entries = [self.entries[i] for i in live]
+        self.head = 0
+
+    def query(self, rect):
+        """Entities with a hit rect overlapping rect, left to right"""
+        scrolled = self.scrolled
+        start = bisect_left(self.keys, rect.left + scrolled - self.max_width - self.MARGIN, self.head)
+        right = rect.right + scrolled + self.MARGIN
+        hits = []
+        for i in range(start, len(self.entries)):
+            if self.keys[i] > right:
+                break
+            entity = self.entries[i]
+            if entity is not None and rect.collidelist(self.rects(entity)) != -1:
+                hits.append(entity)
+        return hits
+
+    def last(self):
+        """The rightmost entity, or None"""
+        for i in range(len(self.entries) - 1, self.head - 1, -1):
+            if self.entries[i] is not None:
+                return self.entries[i]
+        return None
+
+    def __iter__(self):
+        for i in range(self.head, len(self.entries)):
+            entity = self.entries[i]
+            if entity is not None:
+                yield entity
+
+    def __len__(self):
+        return self.live
+
+
+class UniformGrid:
+    """Buckets freely moving entities by cell so a rect query only looks nearby"""
+
+    def __init__(self, cell_size=100, rect=lambda entity: entity.get_rect()):
+        self.cell_size = cell_size
+        self.rect = rect
+        self.cells = {}
+
+    def rebuild(self, entities):
+        self.cells = {}
+        size = self.cell_size
+        for entity in entities:
+            rect = self.rect(entity)
+            for cell_x in range(rect.left // size, rect.right // size + 1):
+                for cell_y in range(rect.top // size, rect.bottom // size + 1):
+                    self.cells.setdefault((cell_x, cell_y), []).append((entity, rect))
+
+    def clear(self):
+        self.cells = {}
+
+    def query(self, rect):
+        size = self.cell_size
+        hits = []
+        seen = set()
+        for cell_x in range(rect.left // size, rect.right // size + 1):
+            for cell_y in range(rect.top // size, rect.bottom // size + 1):
+                for entity, entity_rect in self.cells.get((cell_x, cell_y), ()):
+                    if id(entity) not in seen and rect.colliderect(entity_rect):
+                        seen.add(id(entity))
+                        hits.append(entity)
+        return hits
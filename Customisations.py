@@ -1,15 +1,23 @@
 import pygame
 import random
+from Fonts import fonts
 
 class Skin:
-    def __init__(self, name, base_color, cost, pattern=None, border_radius=10):
+    def __init__(self, name, base_color, cost, pattern=None, border_radius=10, animated=False):
         self.name = name
         self.base_color = base_color
         self.cost = cost
         self.pattern = pattern
         self.border_radius = border_radius
+        self.animated = animated  # Pattern is random, so it gets several baked frames to cycle through
 
-    def draw_preview(self, surface, rect):
+    def draw_preview(self, surface, rect, now=None):
+        skin_renderer.draw_preview(surface, rect, self, now)
+
+    def draw_robot(self, surface, rect, skin, now=None):
+        skin_renderer.draw_robot(surface, rect, skin, now)
+
+    def render_preview(self, surface, rect):
         # Drop shadow
         shadow_offset = 6
         shadow_rect = rect.move(shadow_offset, shadow_offset)
@@ -28,10 +36,9 @@ class Skin:
         # Inner border for depth
         pygame.draw.rect(surface, (0, 0, 0), rect, width=2, border_radius=self.border_radius)
 
-    def draw_robot(self, surface, rect, skin):
-        # Create a temporary surface for the robot with per-pixel alpha
+    def render_robot(self, surface, rect):
+        # Temporary surface for the robot with per-pixel alpha
         temp = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        temp = temp.convert_alpha()
 
         # Draw base rectangle
         pygame.draw.rect(temp, self.base_color, temp.get_rect(), border_radius=1)
@@ -43,16 +50,79 @@ class Skin:
         # Blit the robot to the main surface
         surface.blit(temp, rect.topleft)
 
-        if(skin.name != "None"):
+        if(self.name != "None"):
             # Draw neon border on main surface (so it glows outside the robot)
             pygame.draw.rect(surface, (0, 255, 100), rect.inflate(2, 2), width=2, border_radius=1)
 
+
+class SkinRenderer:
+    """Skins baked into sprites per (skin, size), so drawing one is a single blit.
+
+    Skins with random patterns get ANIMATION_FRAMES frames that are cycled
+    instead of re-rolling the pattern every frame. The robot sprites include
+    the neon border, the previews their shadow and glow.
+    """
+    ANIMATION_FRAMES = 8
+    FRAME_MS = 120
+    ROBOT_MARGIN = 1  # The neon border sits just outside the robot
+    PREVIEW_MARGIN = 36  # Patterns draw past the preview: glow rings, circuit lines
+
+    def __init__(self):
+        self.frames = {}  # (kind, skin name, width, height) -> frames
+
+    def prepare(self, skin, width, height):
+        """Bake a skin's robot frames ahead of time (when it's equipped)"""
+        return self._frames("robot", skin, width, height)
+
+    def draw_robot(self, surface, rect, skin, now=None):
+        frame = self._pick(self._frames("robot", skin, rect.width, rect.height), now)
+        surface.blit(frame, (rect.x - self.ROBOT_MARGIN, rect.y - self.ROBOT_MARGIN))
+
+    def draw_preview(self, surface, rect, skin, now=None):
+        frame = self._pick(self._frames("preview", skin, rect.width, rect.height), now)
+        surface.blit(frame, (rect.x - self.PREVIEW_MARGIN, rect.y - self.PREVIEW_MARGIN))
+
+    def _pick(self, frames, now):
+        if len(frames) == 1:
+            return frames[0]
+        if now is None:
+            now = pygame.time.get_ticks()
+        return frames[int(now // self.FRAME_MS) % len(frames)]
+
+    def _frames(self, kind, skin, width, height):
+        key = (kind, skin.name, width, height)
+        frames = self.frames.get(key)
+        if frames is None:
+            count = self.ANIMATION_FRAMES if skin.animated else 1
+            frames = self.frames[key] = [self._bake(kind, skin, width, height) for _ in range(count)]
+        return frames
+
+    def _bake(self, kind, skin, width, height):
+        margin = self.ROBOT_MARGIN if kind == "robot" else self.PREVIEW_MARGIN
+        frame = pygame.Surface((width + 2 * margin, height + 2 * margin), pygame.SRCALPHA)
+        rect = pygame.Rect(margin, margin, width, height)
+        if kind == "robot":
+            skin.render_robot(frame, rect)
+        else:
+            skin.render_preview(frame, rect)
+        if pygame.display.get_surface() is not None:
+            frame = frame.convert_alpha()
+        return frame
+
+
+skin_renderer = SkinRenderer()  # Shared by the robot and the shop
+
 class Trail:
+    FADE_BANDS = 8  # The trail line fades in this many steps, one draw call each
+    PARTICLE_RADIUS = 7  # Big enough for every effect function
+
     def __init__(self, name, effect_function, cost, color=(0,255,0)):
         self.name = name
         self.effect_function = effect_function
         self.cost = cost
         self.color = color
+        self._fade_palette = None
+        self._particle_sprite = None
 
     def get_color(self):
         return self.color
@@ -62,6 +132,31 @@ class Trail:
         # print("Drawing trail at", position)
         self.effect_function(surface, position)
 
+    def draw_line(self, surface, points):
+        """The fading trail line through points (oldest first), one lines() call per fade band"""
+        if self._fade_palette is None:
+            self._fade_palette = [tuple(int(c * (band + 1) / self.FADE_BANDS) for c in self.color)
+                                  for band in range(self.FADE_BANDS)]
+        segments = len(points) - 1
+        for band, color in enumerate(self._fade_palette):
+            first = band * segments // self.FADE_BANDS
+            last = (band + 1) * segments // self.FADE_BANDS
+            if last > first:
+                pygame.draw.lines(surface, color, False, points[first:last + 1], 4)
+
+    def draw_particles(self, surface, positions):
+        """The effect at every position, blitted from a sprite baked on first use"""
+        if self._particle_sprite is None:
+            r = self.PARTICLE_RADIUS
+            sprite = pygame.Surface((r * 2 + 1, r * 2 + 1), pygame.SRCALPHA)
+            self.effect_function(sprite, (r, r))
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._particle_sprite = sprite
+        r = self.PARTICLE_RADIUS
+        sprite = self._particle_sprite
+        surface.blits([(sprite, (x - r, y - r)) for x, y in positions], doreturn=False)
+
     def draw_preview(self, surface, rect):
         center = rect.center
         radius = min(rect.width, rect.height) // 4
@@ -117,7 +212,7 @@ def matrix_pattern(surface, rect):
     # Matrix rain effect
     chars = "01"
     # Even smaller font and very few characters to ensure maximum spread
-    font = pygame.font.SysFont("Consolas", 8, bold=True) # Changed from 7 to 6
+    font = fonts.get(8, face=None, fallback="Consolas")  # Changed from 7 to 6, the service opens it once
     num_chars = 4 # Changed from 6 to 4 (very few characters for sparsity)
 
     for _ in range(num_chars):
@@ -166,12 +261,12 @@ def matrix_trail(surface, position):
 
 skins = [
     Skin("None", (255, 255, 255), 0, pattern=None, border_radius=10),  # White rectangle, always free
-    Skin("Slime", (100, 200, 100), 3000, pattern=circuit_pattern, border_radius=10),
+    Skin("Slime", (100, 200, 100), 3000, pattern=circuit_pattern, border_radius=10, animated=True),
     Skin("Striped Green", (30, 180, 60), 3000, striped_pattern, border_radius=10),
-    Skin("Ice", (120, 200, 255), 3000, icy_pattern, border_radius=10),
+    Skin("Ice", (120, 200, 255), 3000, icy_pattern, border_radius=10, animated=True),
     Skin("Glow Blue", (80, 180, 255), 4000, glow_pattern, border_radius=10),
     Skin("Samuri", (40, 40, 40), 5000, honeycomb_pattern, border_radius=10),
-    Skin("Matrix", (10, 30, 10), 5000, matrix_pattern, border_radius=10),
+    Skin("Matrix", (10, 30, 10), 5000, matrix_pattern, border_radius=10, animated=True),
 ]
 
 trails = [
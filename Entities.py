@@ -0,0 +1,223 @@
+from functools import partial
+from Obstacle import Obstacle, PairedObstacle, MovingObstacle
+from Coin import Coin
+from InGameThings import Virus
+
+try:
+    import numpy as np
+except ImportError:  # The entity store is optional, plain objects work without NumPy
+    np = None
+
+numpy_available = np is not None
+
+
+def _column(name):
+    """Attribute stored in one of the store's arrays instead of on the object"""
+    def get(self):
+        return getattr(self._store, name).item(self._slot)
+
+    def set(self, value):
+        getattr(self._store, name)[self._slot] = value
+
+    return property(get, set)
+
+
+class EntityStore:
+    """Struct-of-arrays positions for one kind of entity, one slot per live entity.
+
+    Every column is a float64 array. Slots of released entities are reused, and
+    updates run over all slots up to the high-water mark, so their cost doesn't
+    depend on how many Python objects are alive.
+    """
+    COLUMNS = ()
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        for name in self.COLUMNS:
+            setattr(self, name, np.zeros(capacity))
+        self.clear()
+
+    def clear(self):
+        self.count = 0  # High-water mark
+        self.free = []
+
+    def allocate(self):
+        if self.free:
+            slot = self.free.pop()
+        else:
+            if self.count == self.capacity:
+                self._grow()
+            slot = self.count
+            self.count += 1
+        for name in self.COLUMNS:
+            getattr(self, name)[slot] = 0
+        return slot
+
+    def release(self, slot):
+        self.free.append(slot)
+
+    def _grow(self):
+        self.capacity *= 2
+        for name in self.COLUMNS:
+            column = np.zeros(self.capacity)
+            column[:self.count] = getattr(self, name)
+            setattr(self, name, column)
+
+
+class ObstacleStore(EntityStore):
+    COLUMNS = ("x", "prev_x", "y", "prev_y", "base_y", "amplitude", "speed", "time", "oscillating")
+
+    def update(self, scroll_speed, dt):
+        n = self.count
+        x = self.x[:n]
+        self.prev_x[:n] = x
+        x -= scroll_speed * dt
+
+        # Oscillating obstacles (np.sin can differ from math.sin in the last bit)
+        moving = np.flatnonzero(self.oscillating[:n])
+        if len(moving):
+            self.prev_y[moving] = self.y[moving]
+            self.time[moving] += dt
+            self.y[moving] = self.base_y[moving] + np.sin(self.time[moving] * self.speed[moving]) * self.amplitude[moving]
+
+
+class CoinStore(EntityStore):
+    COLUMNS = ("x", "prev_x")
+
+    def update(self, scroll_speed, dt):
+        n = self.count
+        x = self.x[:n]
+        self.prev_x[:n] = x
+        x -= scroll_speed * dt
+
+
+class VirusStore(EntityStore):
+    COLUMNS = ("x", "prev_x", "y", "prev_y", "speed")
+
+    def update(self, scroll_speed, x_coord, y_coord, dt):
+        # Same homing as Virus._move, for every virus at once
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+
+        dx = x_coord - x
+        dy = y_coord - y
+        distance = np.maximum(1, np.sqrt(dx * dx + dy * dy))
+        speed = self.speed[:n]
+        x += (dx / distance) * speed * 0.4 * dt
+        y += (dy / distance) * (speed + (scroll_speed * 0.1) ** 1.5) * dt
+        x -= scroll_speed * dt
+
+
+class _Stored:
+    """Keeps the entity's position in a store's arrays; the store moves it"""
+
+    def __init__(self, store, *args, **kwargs):
+        self._store = store
+        self._slot = store.allocate()
+        super().__init__(*args, **kwargs)
+
+    def _move(self, *args):
+        pass  # Done for all entities of the kind by the store's update()
+
+
+class StoredObstacle(_Stored, Obstacle):
+    _Obstacle__x = _column("x")
+    _Obstacle__prev_x = _column("prev_x")
+    _Obstacle__y = _column("y")
+
+
+class StoredPairedObstacle(_Stored, PairedObstacle):
+    _PairedObstacle__x = _column("x")
+    _PairedObstacle__prev_x = _column("prev_x")
+
+
+class StoredMovingObstacle(_Stored, MovingObstacle):
+    _MovingObstacle__x = _column("x")
+    _MovingObstacle__prev_x = _column("prev_x")
+    _MovingObstacle__y = _column("y")
+    _MovingObstacle__prev_y = _column("prev_y")
+    _MovingObstacle__base_y = _column("base_y")
+    _MovingObstacle__amplitude = _column("amplitude")
+    _MovingObstacle__speed = _column("speed")
+    _MovingObstacle__oscillate_time = _column("time")
+
+    def __init__(self, store, *args, **kwargs):
+        super().__init__(store, *args, **kwargs)
+        store.oscillating[self._slot] = 1
+
+
+class StoredCoin(_Stored, Coin):
+    x = _column("x")
+    prev_x = _column("prev_x")
+
+
+class StoredVirus(_Stored, Virus):
+    x = _column("x")
+    prev_x = _column("prev_x")
+    y = _column("y")
+    prev_y = _column("prev_y")
+    speed = _column("speed")
+
+
+class ObjectEntities:
+    """Entities as plain objects that each move themselves (the default)"""
+    Obstacle = Obstacle
+    PairedObstacle = PairedObstacle
+    MovingObstacle = MovingObstacle
+    Coin = Coin
+    Virus = Virus
+
+    def move_obstacles(self, scroll_speed, dt):
+        pass
+
+    def move_coins(self, scroll_speed, dt):
+        pass
+
+    def move_viruses(self, scroll_speed, x_coord, y_coord, dt):
+        pass
+
+    def release(self, entity):
+        pass
+
+    def clear(self):
+        pass
+
+
+class StoreEntities:
+    """Entities whose positions live in NumPy arrays, moved one kind at a time.
+
+    The classes are drop-in subclasses of the plain ones (same constructor
+    arguments and getters), so everything else treats them the same.
+    """
+
+    def __init__(self):
+        self.obstacles = ObstacleStore()
+        self.coins = CoinStore()
+        self.viruses = VirusStore()
+        self.Obstacle = partial(StoredObstacle, self.obstacles)
+        self.PairedObstacle = partial(StoredPairedObstacle, self.obstacles)
+        self.MovingObstacle = partial(StoredMovingObstacle, self.obstacles)
+        self.Coin = partial(StoredCoin, self.coins)
+        self.Virus = partial(StoredVirus, self.viruses)
+
+    def move_obstacles(self, scroll_speed, dt):
+        self.obstacles.update(scroll_speed, dt)
+
+    def move_coins(self, scroll_speed, dt):
+        self.coins.update(scroll_speed, dt)
+
+    def move_viruses(self, scroll_speed, x_coord, y_coord, dt):
+        self.viruses.update(scroll_speed, x_coord, y_coord, dt)
+
+    def release(self, entity):
+        store = getattr(entity, "_store", None)
+        if store is not None:  # Keys and glitch collectibles are plain objects
+            store.release(entity._slot)
+
+    def clear(self):
+        self.obstacles.clear()
+        self.coins.clear()
+        self.viruses.clear()
@@ -0,0 +1,92 @@
+import pygame
+from collections import OrderedDict
+from Assets import resource_path
+
+try:
+    import pygame.freetype as freetype
+except ImportError:  # Not in every pygame build, text is rendered with pygame.font then
+    freetype = None
+
+
+DOS_FONT = "fonts/Retro/Perfect DOS VGA 437.ttf"
+FALLBACK_FONT = "Courier New"  # System font used when a font file can't be loaded
+
+# Sizes the menus, HUD and profiler use, opened by preload() at startup
+GAME_SIZES = (14, 16, 20, 24, 28, 30, 32, 48, 64)
+
+
+class FontService:
+    """Every font in the game, each face and size opened once.
+
+    Rendered text goes into an LRU cache keyed by (text, colour, size, face),
+    so labels that are drawn every frame are only rasterized once. With
+    use_freetype, render_to() draws through pygame.freetype straight onto the
+    target instead.
+    """
+    MAX_TEXT_SURFACES = 512
+
+    def __init__(self, use_freetype=False):
+        self.fonts = {}
+        self.freetype_fonts = {}
+        self.text_surfaces = OrderedDict()
+        self.use_freetype = use_freetype and freetype is not None
+
+    def get(self, size, face=DOS_FONT, fallback=FALLBACK_FONT, bold=True):
+        """The pygame.font.Font for a face and size; face None goes straight to the fallback"""
+        key = (face, size, fallback, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            try:
+                if face is None:
+                    raise FileNotFoundError("no font file")
+                font = pygame.font.Font(resource_path(face), size)
+            except Exception:
+                font = pygame.font.SysFont(fallback, size, bold=bold)
+            self.fonts[key] = font
+        return font
+
+    def preload(self, sizes=GAME_SIZES, face=DOS_FONT):
+        for size in sizes:
+            self.get(size, face)
+
+    def preload_glyphs(self, characters, color, size, face=DOS_FONT):
+        """Render single characters ahead of time, e.g. the digits a counter is built from"""
+        for character in characters:
+            self.render(character, color, size, face)
+
+    def render(self, text, color, size, face=DOS_FONT):
+        """Antialiased text surface, shared by everyone who draws the same text"""
+        key = (text, tuple(color), size, face)
+        surface = self.text_surfaces.get(key)
+        if surface is None:
+            surface = self.get(size, face).render(text, True, color)
+            self.text_surfaces[key] = surface
+            if len(self.text_surfaces) > self.MAX_TEXT_SURFACES:
+                self.text_surfaces.popitem(last=False)
+        else:
+            self.text_surfaces.move_to_end(key)
+        return surface
+
+    def render_to(self, surface, pos, text, color, size, face=DOS_FONT):
+        """Draw text onto surface at pos and return the rect it covers"""
+        if self.use_freetype:
+            return self._freetype(size, face).render_to(surface, pos, text, color)
+        return surface.blit(self.render(text, color, size, face), pos)
+
+    def _freetype(self, size, face):
+        key = (face, size)
+        font = self.freetype_fonts.get(key)
+        if font is None:
+            try:
+                font = freetype.Font(resource_path(face), size)
+            except Exception:
+                font = freetype.SysFont(FALLBACK_FONT, size, bold=True)
+            font.antialiased = True
+            self.freetype_fonts[key] = font
+        return font
+
+    def clear(self):
+        self.text_surfaces.clear()
+
+
+fonts = FontService()
@@ -0,0 +1,94 @@
+import pygame
+from Fonts import fonts
+
+
+# Colors for the timer
+GREEN = (0, 255, 0)  # Classic terminal green
+CYAN = (0, 255, 255)  # For glitch effects
+DARK_GREY = (20, 20, 20)  # Semi-transparent background
+RED = (255, 0, 0)
+GREY = (128, 128, 128)
+
+
+class HackerHud:
+    """The in-game HUD, kept between frames.
+
+    Fonts, text and panels are made once and redrawn only when a shown value
+    changes: the whole-second timer, the score or the key fragments. Numbers
+    are put together from cached digit glyphs.
+    """
+    PADDING_X = 10
+    PADDING_Y = 8
+    LINE_SPACING = 6
+
+    def __init__(self, hacker_font):
+        self.hacker_font = hacker_font
+        self.small_size = 20  # Smaller font for compact display
+        fonts.preload_glyphs("0123456789", GREEN, self.small_size)
+        fonts.preload_glyphs("0123456789", CYAN, self.small_size)
+        self.intrusion_surface = hacker_font.render("INTRUSION DETECTED!", True, RED)  # Fixed typo
+
+        self.shown = None  # (time, best, total data) on the panel
+        self.panel = None
+        self.shown_keys = None
+        self.keys_panel = None
+
+    def _line(self, prefix, number, suffix, color):
+        """prefix + number + suffix as one surface, the number from digit glyphs"""
+        parts = [fonts.render(prefix, color, self.small_size)]
+        parts += [fonts.render(digit, color, self.small_size) for digit in str(number)]
+        parts.append(fonts.render(suffix, color, self.small_size))
+        line = pygame.Surface((sum(part.get_width() for part in parts), max(part.get_height() for part in parts)),
+                              pygame.SRCALPHA)
+        x = 0
+        for part in parts:
+            line.blit(part, (x, 0))
+            x += part.get_width()
+        return line
+
+    def _build_panel(self, lines, border_color):
+        # Box around the lines, sized to the widest
+        width = max(line.get_width() for line in lines) + 2 * self.PADDING_X
+        height = (sum(line.get_height() for line in lines) +
+                  (len(lines) - 1) * self.LINE_SPACING +
+                  2 * self.PADDING_Y)
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(panel, (*DARK_GREY, 200), (0, 0, width, height), border_radius=5)
+        pygame.draw.rect(panel, border_color, (0, 0, width, height), 1, border_radius=5)
+
+        y = self.PADDING_Y
+        for line in lines:
+            panel.blit(line, (self.PADDING_X, y))
+            y += line.get_height() + self.LINE_SPACING
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert_alpha()
+        return panel
+
+    def draw(self, screen, elapsed_seconds, total_score, score, best_time, keys_collected, portal_active):
+        screenWidth = screen.get_width()
+
+        # Base UI elements (always visible)
+        shown = (int(elapsed_seconds), int(best_time), total_score + score)
+        if shown != self.shown:
+            self.shown = shown
+            self.panel = self._build_panel([
+                self._line("TIME: ", shown[0], " SEC", GREEN),
+                self._line("BEST TIME: ", shown[1], " SEC", GREEN),
+                self._line("TOTAL DATA: ", shown[2], " Mb", GREEN),
+            ], GREEN)
+
+        # Top-right corner
+        screen.blit(self.panel, (screenWidth - self.panel.get_width() - 10, 10))
+
+        # Only show portal-related UI elements if portal is active
+        if portal_active:
+            # Show intrusion warning
+            screen.blit(self.intrusion_surface, ((screenWidth/2)-150, 10))
+
+            # Show key fragments collected (appears below main UI)
+            if keys_collected != self.shown_keys:
+                self.shown_keys = keys_collected
+                self.keys_panel = self._build_panel([self._line("KEY FRAGMENTS: ", keys_collected, "/5", CYAN)], CYAN)
+            screen.blit(self.keys_panel,
+                        (screenWidth - self.keys_panel.get_width(),
+                         self.panel.get_height() + 20))  # Position below main UI
@@ -1,11 +1,17 @@
 import pygame
 import random
 import math
+import heapq
+from Collision import UniformGrid
+from Particles import VIRUS_TRAIL
 
 class Virus:
-    def __init__(self, x, y, target_x, target_y):
+    def __init__(self, x, y, target_x, target_y, fx_rng=random, particles=None):
+        self.fx_rng = fx_rng  # Looks only, the homing movement is deterministic
         self.x = x
         self.y = y
+        self.prev_x = x  # Position before the last update, for interpolated drawing
+        self.prev_y = y
         self.base_radius = 15
         self.radius = self.base_radius
         self.speed = 2
@@ -14,71 +20,71 @@ class Virus:
         self.base_color = (255, 50, 50)  # Core red color
         self.pulse_timer = 0
         self.rotation_angle = 0
-        self.spikes = random.randint(6, 10)  # Random number of spikes
-        self.spike_length = random.uniform(1.2, 1.5)  # Spike length multiplier
+        self.spikes = fx_rng.randint(6, 10)  # Random number of spikes
+        self.spike_length = fx_rng.uniform(1.2, 1.5)  # Spike length multiplier
         self.inner_circle_ratio = 0.6  # Inner circle size ratio
-        self.particle_trail = []
-        self.max_particles = 15
+        self.particles = particles  # Shared ParticlePool for the trail
+        self.max_particles = 15  # Trail particles alive at once, the shared pool only bounds all of them together
+        self.trail_clock = 0  # Frames this virus has lived
+        self.trail_ends = []  # Heap of when each of its live trail particles dies, on trail_clock
         
-    def update(self, scroll_speed, x_coord, y_coord):
-        # Store previous position for particle trail
-        prev_x, prev_y = self.x, self.y
+    def update(self, scroll_speed, x_coord, y_coord, dt=1.0):
+        self._move(scroll_speed, x_coord, y_coord, dt)
+        # Previous position for particle trail
+        prev_x, prev_y = self.prev_x, self.prev_y
         
+        # Update effects
+        self.pulse_timer += 0.1 * dt
+        self.rotation_angle += 0.02 * dt
+        self.radius = self.base_radius + 2 * math.sin(self.pulse_timer)
+        
+        # Forget trail particles that have died in the pool
+        self.trail_clock += dt
+        trail_ends = self.trail_ends
+        while trail_ends and trail_ends[0] <= self.trail_clock:
+            heapq.heappop(trail_ends)
+
+        # Add particle to trail
+        if self.particles is not None and self.fx_rng.random() < 0.3 * dt:  # 30% chance to add particle each frame
+            size = self.fx_rng.randint(2, 4)
+            life = self.fx_rng.randint(20, 30)
+            # Keep trail from growing too long, particles move slower than virus
+            if (len(trail_ends) < self.max_particles and
+                    self.particles.emit(VIRUS_TRAIL, prev_x, prev_y, 0, 0, life, size, scroll=0.5)):
+                heapq.heappush(trail_ends, self.trail_clock + life)
+            
+    def _move(self, scroll_speed, x_coord, y_coord, dt):
+        # Position only, an entity store does this for all viruses at once
+        self.prev_x, self.prev_y = self.x, self.y
+
         # Move toward player with magnet effect
         dx = x_coord - self.x
         dy = y_coord - self.y
         distance = max(1, math.sqrt(dx*dx + dy*dy))
         
-        self.x += (dx / distance) * self.speed*0.4
-        self.y += (dy / distance) * (self.speed + (scroll_speed*0.1)**1.5) 
+        self.x += (dx / distance) * self.speed*0.4 * dt
+        self.y += (dy / distance) * (self.speed + (scroll_speed*0.1)**1.5) * dt
         
         # Scroll with background
-        self.x -= scroll_speed
-        
-        # Update effects
-        self.pulse_timer += 0.1
-        self.rotation_angle += 0.02
-        self.radius = self.base_radius + 2 * math.sin(self.pulse_timer)
-        
-        # Add particle to trail
-        if random.random() < 0.3:  # 30% chance to add particle each frame
-            self.particle_trail.append({
-                'x': prev_x,
-                'y': prev_y,
-                'size': random.randint(2, 4),
-                'life': random.randint(20, 30)
-            })
-        
-        # Update and cull particles
-        self.particle_trail = [p for p in self.particle_trail if p['life'] > 0]
-        for p in self.particle_trail:
-            p['life'] -= 1
-            p['x'] -= scroll_speed * 0.5  # Particles move slower than virus
-            
-        # Keep trail from growing too long
-        if len(self.particle_trail) > self.max_particles:
-            self.particle_trail.pop(0)
-            
-    def draw(self, screen):
-        # Draw particle trail first (behind virus)
-        for p in self.particle_trail:
-            alpha = int(255 * (p['life'] / 30))
-            color = (255, 100, 100, alpha)
-            pygame.draw.circle(screen, color, (int(p['x']), int(p['y'])), p['size'])
-        
+        self.x -= scroll_speed * dt
+
+    def draw(self, screen, alpha=1.0):
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+
         # Draw pulsing glow effect
         glow_radius = self.radius + 8 * math.sin(self.pulse_timer * 0.5)
         glow_surface = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
         pygame.draw.circle(glow_surface, (255, 50, 50, 50), 
                           (glow_radius, glow_radius), glow_radius)
-        screen.blit(glow_surface, (int(self.x - glow_radius), int(self.y - glow_radius)))
+        screen.blit(glow_surface, (int(x - glow_radius), int(y - glow_radius)))
         
         # Draw main virus body
-        pygame.draw.circle(screen, self.base_color, (int(self.x), int(self.y)), self.radius)
+        pygame.draw.circle(screen, self.base_color, (int(x), int(y)), self.radius)
         
         # Draw inner circle (darker core)
         inner_color = (200, 30, 30)
-        pygame.draw.circle(screen, inner_color, (int(self.x), int(self.y)), 
+        pygame.draw.circle(screen, inner_color, (int(x), int(y)), 
                          self.radius * self.inner_circle_ratio)
         
         # Draw spikes
@@ -86,60 +92,70 @@ class Virus:
         for i in range(self.spikes):
             angle = self.rotation_angle + i * spike_angle
             # Base of spike
-            x1 = self.x + math.cos(angle) * self.radius * 0.8
-            y1 = self.y + math.sin(angle) * self.radius * 0.8
+            x1 = x + math.cos(angle) * self.radius * 0.8
+            y1 = y + math.sin(angle) * self.radius * 0.8
             # Tip of spike
-            x2 = self.x + math.cos(angle) * self.radius * self.spike_length
-            y2 = self.y + math.sin(angle) * self.radius * self.spike_length
+            x2 = x + math.cos(angle) * self.radius * self.spike_length
+            y2 = y + math.sin(angle) * self.radius * self.spike_length
             
             pygame.draw.line(screen, (255, 100, 100), (x1, y1), (x2, y2), 2)
         
         # Draw pulsing outline
         outline_width = 1 + math.sin(self.pulse_timer)
-        pygame.draw.circle(screen, (255, 150, 150), (int(self.x), int(self.y)), 
+        pygame.draw.circle(screen, (255, 150, 150), (int(x), int(y)), 
                          self.radius + 3, int(outline_width))
         
     def get_rect(self):
         return pygame.Rect(self.x - self.radius, self.y - self.radius, 
                          self.radius * 2, self.radius * 2)
 
+    def get_motion(self):
+        return (self.x - self.prev_x, self.y - self.prev_y)
+
 class Portal:
     def __init__(self, x, is_entry=True):
         self.x = x
+        self.prev_x = x
         self.width = 50
         self.animation_frame = 0
         self.is_entry = is_entry
         self.active = True
     
-    def update(self, scroll_speed):
-        self.animation_frame = (self.animation_frame + 0.2) % 10
-        self.x -= scroll_speed
+    def update(self, scroll_speed, dt=1.0):
+        self.animation_frame = (self.animation_frame + 0.2 * dt) % 10
+        self.prev_x = self.x
+        self.x -= scroll_speed * dt
         
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
 
         if not self.active:
             return
             
         color = (0, 200, 255) if self.is_entry else (255, 150, 0)
-        alpha = 150 + int(50 * math.sin(self.animation_frame))
+        portal_alpha = 150 + int(50 * math.sin(self.animation_frame))
         
         # Full height portal
         portal_height = screen.get_height()
         portal_surface = pygame.Surface((self.width, portal_height), pygame.SRCALPHA)
-        pygame.draw.rect(portal_surface, (*color, alpha), 
+        pygame.draw.rect(portal_surface, (*color, portal_alpha), 
                         (0, 0, self.width, portal_height))
-        screen.blit(portal_surface, (self.x, 0))
+        screen.blit(portal_surface, (self.prev_x + (self.x - self.prev_x) * alpha, 0))
         
     def get_rect(self, screen_height):
         return pygame.Rect(self.x, 0, self.width, screen_height)
 
 class PortalSystem:
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, rng=random, fx_rng=random):
+        self.rng = rng  # Portal and virus spawns
+        self.fx_rng = fx_rng  # Virus looks
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.entry_portal = None
         self.exit_portal = None
         self.viruses = []
+        self.virus_grid = UniformGrid()  # Rebuilt every update, viruses move freely
+        self.entities = None  # Optional entity store that creates and moves the viruses (Entities.py)
+        self.particles = None  # ParticlePool the virus trails go to
         self.active = False
         self.portal_timer = 0
         self.portal_duration = 8000  # Max duration as fallback
@@ -148,52 +164,61 @@ class PortalSystem:
         self.last_spawn_time = 0
         self.spawn_cooldown = 1000
 
-    def try_spawn_portal(self):
-        if not self.active and self.entry_portal == None and random.random() < 0.001:
+    def try_spawn_portal(self, dt=1.0):
+        if not self.active and self.entry_portal == None and self.rng.random() < 0.001 * dt:
             self.entry_portal = Portal(self.screen_width, True)
             return True
         return False
         
-    def activate(self, player, obstacles):
+    def activate(self, player, obstacles, current_time=None):
         self.active = True
         self.awaiting_exit = True  # Player must use exit portal
-        self.portal_timer = pygame.time.get_ticks()
+        self.portal_timer = pygame.time.get_ticks() if current_time is None else current_time
         self.player_inside = True
         
         # Start breaking all existing obstacles
-        for obstacle in obstacles[:]:
+        for obstacle in list(obstacles):
             if hasattr(obstacle, 'start_breaking'):
                 obstacle.start_breaking()
-            obstacles.remove(obstacle)  # Remove immediately
+        obstacles.clear()  # Remove immediately
             
         
             
     
             
-    def update(self, x_coord, y_coord, scroll_speed):
+    def update(self, x_coord, y_coord, scroll_speed, current_time=None, dt=1.0):
 
           # Update portals
         if self.entry_portal:
             scroll_speed = scroll_speed * 1.5 if self.player_inside else scroll_speed
-            self.entry_portal.update(scroll_speed)
+            self.entry_portal.update(scroll_speed, dt)
         if self.exit_portal:
-            self.exit_portal.update(scroll_speed)
+            self.exit_portal.update(scroll_speed, dt)
             
         if not self.active:
             return
             
             
         # Update viruses
-        for virus in self.viruses[:]:
-            virus.update(scroll_speed, x_coord, y_coord)
-            if virus.x < -50:  # Remove off-screen viruses
-                self.viruses.remove(virus)
+        if self.entities:
+            self.entities.move_viruses(scroll_speed, x_coord, y_coord, dt)
+        on_screen = []
+        for virus in self.viruses:
+            virus.update(scroll_speed, x_coord, y_coord, dt)
+            if virus.x >= -50:
+                on_screen.append(virus)
+            elif self.entities:  # Remove off-screen viruses
+                self.entities.release(virus)
+        self.viruses = on_screen
                 
         # Spawn new viruses occasionally
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         if (current_time - self.last_spawn_time > max((300, self.spawn_cooldown-(scroll_speed**2)))):
             self.spawn_virus(x_coord, y_coord)
             self.last_spawn_time = current_time
+
+        self.virus_grid.rebuild(self.viruses)
             
     def end_effect(self):
         self.active = False
@@ -201,15 +226,19 @@ class PortalSystem:
         self.entry_portal = None
         self.exit_portal = None
         self.player_inside = False
+        if self.entities:
+            for virus in self.viruses:
+                self.entities.release(virus)
         self.viruses = []
+        self.virus_grid.clear()
         
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         if self.entry_portal:
-            self.entry_portal.draw(screen)
+            self.entry_portal.draw(screen, alpha)
         if self.exit_portal:
-            self.exit_portal.draw(screen)
+            self.exit_portal.draw(screen, alpha)
         for virus in self.viruses:
-            virus.draw(screen)
+            virus.draw(screen, alpha)
 
     def get_entry_portal_rect(self):
         if self.entry_portal:
@@ -226,15 +255,22 @@ class PortalSystem:
     
     def get_viruses(self):
         return self.viruses
+
+    def get_viruses_hitting(self, rect):
+        """Viruses overlapping rect, as of the last update"""
+        return self.virus_grid.query(rect)
     
     
     def spawn_virus(self, target_x, target_y):
         """Create a new virus targeting the player's position"""
-        new_virus = Virus(
-            x=self.screen_width + random.randint(50, 200),  # Spawn off-screen right
-            y=random.randint(50, self.screen_height - 50),  # Random vertical position
+        virus_class = self.entities.Virus if self.entities else Virus
+        new_virus = virus_class(
+            x=self.screen_width + self.rng.randint(50, 200),  # Spawn off-screen right
+            y=self.rng.randint(50, self.screen_height - 50),  # Random vertical position
             target_x=target_x,
-            target_y=target_y
+            target_y=target_y,
+            fx_rng=self.fx_rng,
+            particles=self.particles
         )
         self.viruses.append(new_virus)
         return new_virus
@@ -107,7 +107,7 @@ class BestTimeManager:
 
     def save_longest_time(self, new_time):
         with open(self.file_path, "w") as file:
-            file.write(str(new_time))
+            file.write(str(round(new_time, 3)))
 
     def update_longest_time(self, current_time):
         longest_time = self.load_longest_time()
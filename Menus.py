@@ -1,19 +1,12 @@
 import pygame
 import random
+import math
 import time
 from Buttons import HackerButton
+from Fonts import fonts
 from Manager import BestTimeManager
-import os
-import sys
 
 
-def resource_path(relative_path):
-    try:
-        base_path = sys._MEIPASS  # PyInstaller temp folder
-    except Exception:
-        base_path = os.path.dirname(os.path.abspath(__file__))  # script folder
-    return os.path.join(base_path, relative_path)
-
 class MainMenu:
     def __init__(self, screen, screenWidth, screenHeight):
         self.screen = screen
@@ -27,12 +20,8 @@ class MainMenu:
         self.error_color = (255, 50, 50)
 
         # Load fonts
-        try:
-            self.title_font = pygame.font.Font(resource_path("fonts/Retro/Perfect DOS VGA 437.ttf"), 64)
-            self.subtitle_font = pygame.font.Font(resource_path("fonts/Retro/Perfect DOS VGA 437.ttf"), 24)
-        except:
-            self.title_font = pygame.font.SysFont("Courier New", 64, bold=True)
-            self.subtitle_font = pygame.font.SysFont("Courier New", 24, bold=True)
+        self.title_font = fonts.get(64)
+        self.subtitle_font = fonts.get(24)
 
         # Create buttons
         button_width = 400
@@ -47,7 +36,14 @@ class MainMenu:
 
         # Matrix rain setup
         self.matrix_chars_set = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZｱｲｳエオカキクケコサシスセソタチツテトﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜﾝ"
-        self.matrix_drops = []
+        self.matrix_font_size = self.subtitle_font.get_height()
+        self.matrix_glyphs = self._bake_matrix_glyphs()
+        # One entry per drop (column) in each list
+        self.drop_x = []
+        self.drop_y = []
+        self.drop_speed = []
+        self.drop_length = []
+        self.drop_characters = []  # Glyph indices, head of the drop first
         self.init_matrix_rain()
 
         # Terminal boot animation
@@ -60,75 +56,128 @@ class MainMenu:
         self.current_message = 0
         self.message_timer = 0
         self.boot_complete = False
+        self.boot_surfaces = {}  # Rendered boot lines, with and without the cursor
+
+        # Static layers, baked once (the score layer again when the total changes)
+        self.background_layer = self._bake_background()
+        self.grid_layer = self._bake_grid()
+        self.title_layer, self.title_pos = self._bake_title()
+        self.subtitle_layer = self.subtitle_font.render("SYSTEM INTRUSION PROTOCOL", True, self.secondary_color)
+        self.subtitle_pos = self.subtitle_layer.get_rect(center=(self.screenWidth // 2, self.screenHeight // 4 + 70))
+        self.score_layer = None
+
+    MATRIX_FADE_LEVELS = 32  # Steps the drops fade in from head to tail
+
+    def _bake_matrix_glyphs(self):
+        """Every rain character at every fade level, indexed char * MATRIX_FADE_LEVELS + level"""
+        glyphs = []
+        base_green_intensity = 180
+        for char in self.matrix_chars_set:
+            for level in range(self.MATRIX_FADE_LEVELS):
+                fade = level / self.MATRIX_FADE_LEVELS  # 0 at the head of the drop, near 1 at the tail
+                glyph = self.subtitle_font.render(char, True, (0, int(base_green_intensity * (1 - fade)), 0)).convert_alpha()
+                # Fade baked into the pixels, blits of per-pixel alpha are cheaper than surface alpha on top
+                glyph.fill((255, 255, 255, int(255 * (1 - fade))), special_flags=pygame.BLEND_RGBA_MULT)
+                glyphs.append(glyph)
+        return glyphs
 
     def _generate_drop_characters(self, length):
-        """Generates a sequence of characters for a single matrix drop."""
-        return [random.choice(self.matrix_chars_set) for _ in range(length)]
+        """Generates a sequence of glyph indices for a single matrix drop."""
+        return [random.randrange(len(self.matrix_chars_set)) for _ in range(length)]
+
+    def _reset_drop(self, i):
+        self.drop_length[i] = random.randint(25, 50)
+        self.drop_y[i] = - (self.drop_length[i] * self.matrix_font_size) - random.randint(0, self.screenHeight // 4)
+        self.drop_speed[i] = random.uniform(1.5, 3.5) # Decreased speed range further
+        self.drop_characters[i] = self._generate_drop_characters(self.drop_length[i])
 
     def init_matrix_rain(self):
         """Initializes matrix rain drops for a continuous vertical flow."""
-        matrix_font_size = self.subtitle_font.get_height()
         for x in range(0, self.screenWidth, 20):
             length = random.randint(25, 50)
-            initial_y = random.randint(-self.screenHeight * 2, -matrix_font_size * 5)
-            
-            self.matrix_drops.append({
-                'x': x,
-                'y': initial_y,
-                'speed': random.uniform(1.5, 3.5), # Decreased speed range further
-                'length': length,
-                'characters': self._generate_drop_characters(length)
-            })
+            self.drop_x.append(x)
+            self.drop_y.append(random.randint(-self.screenHeight * 2, -self.matrix_font_size * 5))
+            self.drop_speed.append(random.uniform(1.5, 3.5))
+            self.drop_length.append(length)
+            self.drop_characters.append(self._generate_drop_characters(length))
 
     def update_matrix_rain(self):
-        matrix_font_size = self.subtitle_font.get_height()
-        for drop in self.matrix_drops:
-            drop['y'] += drop['speed']
+        chars_count = len(self.matrix_chars_set)
+        for i in range(len(self.drop_y)):
+            self.drop_y[i] += self.drop_speed[i]
             
-            if drop['y'] > self.screenHeight:
-                drop['length'] = random.randint(25, 50)
-                drop['y'] = - (drop['length'] * matrix_font_size) - random.randint(0, self.screenHeight // 4)
-                drop['speed'] = random.uniform(1.5, 3.5) # Decreased speed range further
-                drop['characters'] = self._generate_drop_characters(drop['length'])
+            if self.drop_y[i] > self.screenHeight:
+                self._reset_drop(i)
 
             if random.random() < 0.05:
-                idx = random.randint(0, drop['length'] - 1)
-                drop['characters'][idx] = random.choice(self.matrix_chars_set)
+                characters = self.drop_characters[i]
+                characters[random.randrange(len(characters))] = random.randrange(chars_count)
 
     def draw_matrix_rain(self):
-        matrix_font_size = self.subtitle_font.get_height()
+        """All visible rain characters in one blits() call from the glyph atlas"""
+        size = self.matrix_font_size
+        levels = self.MATRIX_FADE_LEVELS
+        glyphs = self.matrix_glyphs
+        blits = []
+        for x, y, length, characters in zip(self.drop_x, self.drop_y, self.drop_length, self.drop_characters):
+            # Only the characters with 0 <= y + i * size < screenHeight
+            first = max(0, math.ceil(-y / size))
+            last = min(length, math.ceil((self.screenHeight - y) / size))
+            for i in range(first, last):
+                blits.append((glyphs[characters[i] * levels + i * levels // length], (x, y + i * size)))
+        self.screen.blits(blits, doreturn=False)
+
+    def _bake_background(self):
+        """Vertical green-to-black gradient background"""
+        layer = pygame.Surface((self.screenWidth, self.screenHeight)).convert()
+        for y in range(self.screenHeight):
+            g = max(0, 50 - y // 4)
+            color = (0, g, 0)
+            pygame.draw.line(layer, color, (0, y), (self.screenWidth, y))
+        return layer
 
-        for drop in self.matrix_drops:
-            for i in range(drop['length']):
-                alpha = max(0, 255 - int(255 * (i / drop['length'])))
-                
-                char = drop['characters'][i]
+    def _bake_grid(self):
+        """HUD-style grid lines on a transparent layer, laid over the rain.
 
-                y_pos = drop['y'] + i * matrix_font_size
+        Transparent through a colour key rather than per-pixel alpha: the layer
+        is mostly empty, and an RLE colour-key blit skips the empty runs where
+        an alpha blit would blend every pixel of the screen.
+        """
+        grid_color = (0, 30, 0)
+        layer = pygame.Surface((self.screenWidth, self.screenHeight)).convert()
+        layer.fill((0, 0, 0))
+        for x in range(0, self.screenWidth, 80):
+            pygame.draw.line(layer, grid_color, (x, 0), (x, self.screenHeight))
+        for y in range(0, self.screenHeight, 80):
+            pygame.draw.line(layer, grid_color, (0, y), (self.screenWidth, y))
+        layer.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return layer
 
-                if 0 <= y_pos < self.screenHeight:
-                    base_green_intensity = 180
-                    g_component = max(0, min(255, base_green_intensity - int(i * (base_green_intensity / drop['length']))))
-                    color = (0, g_component, 0)
-                    
-                    char_surface = self.subtitle_font.render(char, True, color)
-                    char_surface.set_alpha(alpha)
-                    self.screen.blit(char_surface, (drop['x'], y_pos))
+    def _bake_title(self):
+        """The title with its neon blue outline, on one transparent surface"""
+        title_text = self.title_font.render("HACK*LINE", True, self.primary_color)
+        title_rect = title_text.get_rect(center=(self.screenWidth // 2, self.screenHeight // 4))
+
+        # Draw a prominent neon blue outline for the title text
+        outline_color = self.secondary_color
+        outline_thickness = 2
+        layer = pygame.Surface((title_rect.width + 2 * outline_thickness, title_rect.height + 2 * outline_thickness),
+                               pygame.SRCALPHA)
+        outline_surface = self.title_font.render("HACK*LINE", True, outline_color)
+        for dx in range(-outline_thickness, outline_thickness + 1):
+            for dy in range(-outline_thickness, outline_thickness + 1):
+                if dx != 0 or dy != 0:
+                    layer.blit(outline_surface, (outline_thickness + dx, outline_thickness + dy))
+
+        layer.blit(title_text, (outline_thickness, outline_thickness))
+        return layer.convert_alpha(), (title_rect.x - outline_thickness, title_rect.y - outline_thickness)
 
     def draw_gradient_background(self):
-        """Draw a vertical green-to-black gradient background"""
-        for y in range(self.screenHeight):
-            g = max(0, 50 - y // 4)
-            color = (0, g, 0)
-            pygame.draw.line(self.screen, color, (0, y), (self.screenWidth, y))
+        self.screen.blit(self.background_layer, (0, 0))
 
     def draw_grid_overlay(self):
         """Optional HUD-style grid"""
-        grid_color = (0, 30, 0)
-        for x in range(0, self.screenWidth, 80):
-            pygame.draw.line(self.screen, grid_color, (x, 0), (x, self.screenHeight))
-        for y in range(0, self.screenHeight, 80):
-            pygame.draw.line(self.screen, grid_color, (0, y), (self.screenWidth, y))
+        self.screen.blit(self.grid_layer, (0, 0))
 
     def draw_scanline_flicker(self):
         """Occasional flicker line"""
@@ -156,7 +205,9 @@ class MainMenu:
                 msg += "_"
             else:
                 msg += " "
-            text_surface = self.subtitle_font.render(msg, True, (0, 200, 0))
+            text_surface = self.boot_surfaces.get(msg)
+            if text_surface is None:
+                text_surface = self.boot_surfaces[msg] = self.subtitle_font.render(msg, True, (0, 200, 0))
             self.screen.blit(text_surface, (50, self.screenHeight - 150 + i * 30))
 
     def draw(self):
@@ -167,25 +218,9 @@ class MainMenu:
         self.draw_grid_overlay()
         self.draw_scanline_flicker()
 
-        # Title
-        title_text = self.title_font.render("HACK*LINE", True, self.primary_color)
-        title_rect = title_text.get_rect(center=(self.screenWidth // 2, self.screenHeight // 4))
-
-        # Draw a prominent neon blue outline for the title text
-        outline_color = self.secondary_color
-        outline_thickness = 2
-        for dx in range(-outline_thickness, outline_thickness + 1):
-            for dy in range(-outline_thickness, outline_thickness + 1):
-                if dx != 0 or dy != 0:
-                    outline_surface = self.title_font.render("HACK*LINE", True, outline_color)
-                    self.screen.blit(outline_surface, (title_rect.x + dx, title_rect.y + dy))
-
-        self.screen.blit(title_text, title_rect)
-
-        # Subtitle
-        subtitle_text = self.subtitle_font.render("SYSTEM INTRUSION PROTOCOL", True, self.secondary_color)
-        subtitle_rect = subtitle_text.get_rect(center=(self.screenWidth // 2, self.screenHeight // 4 + 70))
-        self.screen.blit(subtitle_text, subtitle_rect)
+        # Title and subtitle
+        self.screen.blit(self.title_layer, self.title_pos)
+        self.screen.blit(self.subtitle_layer, self.subtitle_pos)
 
         # Buttons
         for button in self.buttons:
@@ -195,9 +230,10 @@ class MainMenu:
         self.draw_boot_sequence()
 
         # Draw total score if available
-        score_text = self.subtitle_font.render(f"TOTAL DATA: {self.total_data} Mb", True, self.primary_color)
-        score_rect = score_text.get_rect(center=(self.screenWidth // 2, self.screenHeight - 80))
-        self.screen.blit(score_text, score_rect)
+        if self.score_layer is None:
+            self.score_layer = self.subtitle_font.render(f"TOTAL DATA: {self.total_data} Mb", True, self.primary_color)
+        score_rect = self.score_layer.get_rect(center=(self.screenWidth // 2, self.screenHeight - 80))
+        self.screen.blit(self.score_layer, score_rect)
 
         pygame.display.flip()
 
@@ -211,6 +247,8 @@ class MainMenu:
         return keys[pygame.K_SPACE]
     
     def set_total_score(self, total_data):
+        if total_data != self.total_data:
+            self.score_layer = None  # Re-rendered on the next draw
         self.total_data = total_data
 
 
@@ -225,14 +263,10 @@ class GameOverMenu:
         self.error_color = (255, 50, 50)
         self.warning_color = (255, 150, 0)
 
-        try:
-            self.title_font = pygame.font.Font(resource_path("fonts/Retro/Perfect DOS VGA 437.ttf"), 48)
-            self.stats_font = pygame.font.Font(resource_path("fonts/Retro/Perfect DOS VGA 437.ttf"), 24)
-            self.button_font = pygame.font.Font(resource_path("fonts/Retro/Perfect DOS VGA 437.ttf"), 32)
-        except:
-            self.title_font = pygame.font.SysFont("Courier New", 48, bold=True)
-            self.stats_font = pygame.font.SysFont("Courier New", 24, bold=True)
-            self.button_font = pygame.font.SysFont("Courier New", 32, bold=True)
+        self.title_font = fonts.get(48)
+        self.stats_font = fonts.get(24)
+        self.button_font = fonts.get(32)
+        self.debug_font = fonts.get(16, bold=False)
 
         self.retry_button = HackerButton(
             screenWidth // 2 - 150, screenHeight // 2 + 100,
@@ -240,20 +274,42 @@ class GameOverMenu:
         )
 
         self.stats = {'time_survived': 0, 'data_collected': 0}
+        self.debug_lines = []  # Frame pacing summary, only set in debug mode
+        self.static_layer = None  # Everything but the button, rebuilt when the stats change
 
-    def set_stats(self, time, score, total_score):
-        self.stats = {
+    def set_stats(self, time, score, total_score, seed=None):
+        stats = {
             'time_survived': time,
             'data_collected': score,
             'total_data' : total_score
         }
+        if seed is not None:
+            stats['run_seed'] = seed  # Lets a run be replayed or reported exactly
+        if stats != self.stats:
+            self.stats = stats
+            self.static_layer = None
+
+    def set_debug_lines(self, lines):
+        if lines != self.debug_lines:
+            self.debug_lines = lines
+            self.static_layer = None
 
     def draw(self):
-        self.screen.fill((10, 5, 5))
+        if self.static_layer is None:
+            self.static_layer = self._bake_static_layer()
+        self.screen.blit(self.static_layer, (0, 0))
+
+        self.retry_button.draw(self.screen)
+
+        pygame.display.flip()
+
+    def _bake_static_layer(self):
+        layer = pygame.Surface((self.screenWidth, self.screenHeight)).convert()
+        layer.fill((10, 5, 5))
 
         title_text = self.title_font.render("SYSTEM INTRUSION DETECTED", True, self.error_color)
         title_rect = title_text.get_rect(center=(self.screenWidth // 2, self.screenHeight // 4))
-        self.screen.blit(title_text, title_rect)
+        layer.blit(title_text, title_rect)
 
         stats_y = self.screenHeight // 2 - 80
         for label, value in self.stats.items():
@@ -271,19 +327,22 @@ class GameOverMenu:
                 display_value = str(value)
 
             stat_text = self.stats_font.render(f"> {label_text}: {display_value}", True, (200, 200, 200))
-            self.screen.blit(stat_text, (self.screenWidth // 2 - 150, stats_y))
+            layer.blit(stat_text, (self.screenWidth // 2 - 150, stats_y))
             stats_y += 40
 
-        self.retry_button.draw(self.screen)
+        debug_y = 10
+        for line in self.debug_lines:
+            debug_text = self.debug_font.render(line, True, (120, 120, 120))
+            layer.blit(debug_text, (10, debug_y))
+            debug_y += debug_text.get_height() + 2
 
         continue_text = self.stats_font.render(
             "PRESS [Esc] TO exit OR CLICK COMMAND ABOVE",
             True, (100, 100, 100)
         )
         continue_rect = continue_text.get_rect(center=(self.screenWidth // 2, self.screenHeight - 50))
-        self.screen.blit(continue_text, continue_rect)
-
-        pygame.display.flip()
+        layer.blit(continue_text, continue_rect)
+        return layer
 
     def handle_event(self, event):
         return self.retry_button.check_click(event)
@@ -301,12 +360,11 @@ class Shop:
         self.trails = trails
 
         # Hacker style colors
-        try: # Try to load retro font, fallback to system font
-            self.font = pygame.font.Font(resource_path("fonts/Retro/Perfect DOS VGA 437.ttf"), 20)
-            self.large_font = pygame.font.Font(resource_path("fonts/Retro/Perfect DOS VGA 437.ttf"), 28) # Larger font for section titles
-        except:
-            self.font = pygame.font.SysFont("Courier New", 20, bold=True)
-            self.large_font = pygame.font.SysFont("Courier New", 28, bold=True)
+        # Retro font from the shared font service, it falls back to a system font
+        self.font_size = 20
+        self.large_font_size = 28  # Larger font for section titles
+        self.font = fonts.get(self.font_size)
+        self.large_font = fonts.get(self.large_font_size)
 
 
         self.neon_green = (0, 255, 0)
@@ -385,7 +443,7 @@ class Shop:
             border_thickness = 5 if is_hovered else 3
             pygame.draw.rect(self.screen, border_color, rect, border_thickness, border_radius=12)
 
-            text = self.font.render(tab, True, text_color)
+            text = fonts.render(tab, text_color, self.font_size)
             self.screen.blit(text, (rect.centerx - text.get_width() // 2, rect.centery - text.get_height() // 2))
             self.tab_rects.append((rect, tab))
 
@@ -410,13 +468,13 @@ class Shop:
             border_thickness = 3 if is_hovered else 2
             pygame.draw.rect(self.screen, border_color, rect, border_thickness, border_radius=8)
             
-            text = self.font.render(sub_tab, True, text_color)
+            text = fonts.render(sub_tab, text_color, self.font_size)
             self.screen.blit(text, (rect.centerx - text.get_width() // 2, rect.centery - text.get_height() // 2))
             self.sub_tab_rects.append((rect, sub_tab))
 
         # Section Title for grid
         section_title_text = f"{self.current_tab.upper()} {self.current_sub_tab[self.current_tab].upper()}"
-        section_title_surf = self.large_font.render(section_title_text, True, self.neon_green)
+        section_title_surf = fonts.render(section_title_text, self.neon_green, self.large_font_size)
         section_title_rect = section_title_surf.get_rect(center=(self.width // 2, sub_tab_y + sub_tab_height + 30))
         self.screen.blit(section_title_surf, section_title_rect)
 
@@ -425,7 +483,7 @@ class Shop:
         back_btn_color = self.neon_green if self.back_button.collidepoint(mouse_pos) else self.gray
         pygame.draw.rect(self.screen, back_btn_color, self.back_button, 0, border_radius=8)
         pygame.draw.rect(self.screen, self.neon_green, self.back_button, 3, border_radius=8)
-        back_text = self.font.render("BACK", True, self.bg_color if self.back_button.collidepoint(mouse_pos) else self.neon_green)
+        back_text = fonts.render("BACK", self.bg_color if self.back_button.collidepoint(mouse_pos) else self.neon_green, self.font_size)
         self.screen.blit(back_text, (self.back_button.x + 25, self.back_button.y + 7))
 
         # Draw scroll buttons
@@ -540,7 +598,7 @@ class Shop:
             btn_y = y + self.cell_height - btn_height - padding_bottom
             btn_rect = pygame.Rect(btn_x, btn_y, btn_width, btn_height)
 
-            name_surf = self.font.render(item.name, True, self.neon_green)
+            name_surf = fonts.render(item.name, self.neon_green, self.font_size)
             name_x = x + (self.cell_width - name_surf.get_width()) // 2
             name_y = btn_y - name_surf.get_height() - 5
             grid_surface.blit(name_surf, (name_x, name_y))
@@ -553,7 +611,7 @@ class Shop:
             # Button drawing logic
             if item.name in owned_list:
                 if equipped_id == item.name:
-                    equipped_surf = self.font.render("EQUIPPED", True, self.neon_blue)
+                    equipped_surf = fonts.render("EQUIPPED", self.neon_blue, self.font_size)
                     equipped_rect = equipped_surf.get_rect(center=btn_rect.center)
                     pygame.draw.rect(grid_surface, self.dark_gray, btn_rect, 0, border_radius=8)
                     pygame.draw.rect(grid_surface, self.neon_blue, btn_rect, 2, border_radius=8)
@@ -563,7 +621,7 @@ class Shop:
                     button_text_color = self.bg_color if is_button_hovered else self.bg_color # FIX: Changed text color to bg_color
                     pygame.draw.rect(grid_surface, button_fill_color, btn_rect, 0, border_radius=8)
                     pygame.draw.rect(grid_surface, self.neon_green, btn_rect, 2, border_radius=8)
-                    equip_surf = self.font.render("EQUIP", True, button_text_color)
+                    equip_surf = fonts.render("EQUIP", button_text_color, self.font_size)
                     equip_rect = equip_surf.get_rect(center=btn_rect.center)
                     grid_surface.blit(equip_surf, equip_rect)
             else:
@@ -572,7 +630,7 @@ class Shop:
                 pygame.draw.rect(grid_surface, button_fill_color, btn_rect, 0, border_radius=8)
                 pygame.draw.rect(grid_surface, self.neon_green, btn_rect, 2, border_radius=8)
                 buy_text = f"BUY {item.cost} Mb"
-                buy_surf = self.font.render(buy_text, True, button_text_color)
+                buy_surf = fonts.render(buy_text, button_text_color, self.font_size)
                 buy_rect = buy_surf.get_rect(center=btn_rect.center)
                 grid_surface.blit(buy_surf, buy_rect)
 
@@ -590,7 +648,7 @@ class Shop:
         # Currency display (Mb)
         mb_x = self.width - 180
         mb_y = self.height - 50
-        mb_text = self.font.render(f"DATA: {coins} Mb", True, self.neon_blue)
+        mb_text = fonts.render(f"DATA: {coins} Mb", self.neon_blue, self.font_size)
         self.screen.blit(mb_text, (mb_x, mb_y))
 
 
@@ -603,11 +661,11 @@ class Shop:
             pygame.draw.rect(self.screen, self.dark_gray, popup_rect, border_radius=16)
             pygame.draw.rect(self.screen, self.error_color, popup_rect, 4, border_radius=16)
             
-            msg = self.large_font.render("ACCESS DENIED!", True, self.error_color)
+            msg = fonts.render("ACCESS DENIED!", self.error_color, self.large_font_size)
             msg_rect = msg.get_rect(center=(popup_rect.centerx, popup_y + 40))
             self.screen.blit(msg, msg_rect)
 
-            sub_msg = self.font.render("INSUFFICIENT DATA", True, self.neon_green)
+            sub_msg = fonts.render("INSUFFICIENT DATA", self.neon_green, self.font_size)
             sub_msg_rect = sub_msg.get_rect(center=(popup_rect.centerx, popup_y + 75))
             self.screen.blit(sub_msg, sub_msg_rect)
 
@@ -618,7 +676,7 @@ class Shop:
 
             pygame.draw.rect(self.screen, ok_fill_color, ok_rect, border_radius=8)
             pygame.draw.rect(self.screen, self.neon_green, ok_rect, 2, border_radius=8)
-            ok_text = self.font.render("OVERRIDE", True, ok_text_color)
+            ok_text = fonts.render("OVERRIDE", ok_text_color, self.font_size)
             ok_text_rect = ok_text.get_rect(center=ok_rect.center)
             self.screen.blit(ok_text, ok_text_rect)
             self.not_enough_data_ok_rect = ok_rect
@@ -0,0 +1,84 @@
+import os
+import pygame
+from Assets import resource_path
+
+# Music per game state, None is silence
+TRACKS = {
+    "main_menu": None,
+    "shop": None,
+    "playing": "music/unlocked-hacker-mode.mp3",
+    "game_over": None,
+}
+CROSSFADE_MS = 800
+VOLUME = 0.2
+
+
+class MusicPlayer:
+    """Background music streamed from disk through pygame.mixer.music.
+
+    Only the decoder's buffers are held in memory, not the whole song as
+    PCM. mixer.music is a single stream, so a crossfade is the old track
+    fading out and then the new one fading in. update() moves it along once
+    a frame, nothing here blocks.
+    """
+
+    def __init__(self, tracks=TRACKS, crossfade_ms=CROSSFADE_MS, volume=VOLUME):
+        self.tracks = tracks
+        self.crossfade_ms = crossfade_ms
+        self.volume = volume
+        self.target = None  # Track the current state wants
+        self.current = None  # Track playing or fading out
+        self.fading = False
+        self.missing = set()  # Tracks that failed to load, not tried again
+
+    @property
+    def enabled(self):
+        return pygame.mixer.get_init() is not None
+
+    def set_state(self, state):
+        self.target = self.tracks.get(state)
+
+    def update(self):
+        if (self.current == self.target and not self.fading) or not self.enabled:
+            return  # A track that comes back while fading out finishes the fade and restarts
+
+        if self.current is not None:
+            if not self.fading:
+                pygame.mixer.music.fadeout(self.crossfade_ms)
+                self.fading = True
+            if pygame.mixer.music.get_busy():
+                return  # Still fading out
+            self.current = None
+            self.fading = False
+
+        if self.target is not None and self.target not in self.missing:
+            try:
+                pygame.mixer.music.load(resource_path(self.target))
+                pygame.mixer.music.set_volume(self.volume)
+                pygame.mixer.music.play(fade_ms=self.crossfade_ms)
+            except pygame.error as e:
+                print(f"Error loading music {self.target}: {e}")
+                self.missing.add(self.target)
+                return
+            self.current = self.target
+
+    def stop(self):
+        self.target = self.current = None
+        self.fading = False
+        if self.enabled:
+            pygame.mixer.music.stop()
+
+    def memory_lines(self, sounds):
+        """What the audio holds in memory: decoded sound effects against the streamed music"""
+        lines = ["AUDIO                 KB  MODE"]
+        if not self.enabled:
+            return lines
+        frequency, size, channels = pygame.mixer.get_init()
+        bytes_per_second = frequency * channels * abs(size) // 8
+        for name, sound in sounds.items():
+            lines.append(f"{name:<18}{sound.get_length() * bytes_per_second / 1024:>6.0f}  decoded")
+        for track in sorted(set(track for track in self.tracks.values() if track)):
+            path = resource_path(track)
+            file_size = os.path.getsize(path) if os.path.isfile(path) else 0
+            lines.append(f"{os.path.basename(track)[:18]:<18}{file_size / 1024:>6.0f}  streamed")
+        return lines
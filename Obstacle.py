@@ -1,79 +1,107 @@
 import pygame
 import random
 import math
+from collections import OrderedDict
+from Particles import emit_flame
+
+
+class GradientColumns:
+    """Pre-rendered firewall bars, so an obstacle draws with one blit instead of a rect per pixel column.
+
+    Heights are rounded up to buckets and the blit crops to the real height,
+    which keeps the random obstacle heights down to a few sprites. The least
+    recently used sprite goes once the cache is full.
+    """
+    HEIGHT_BUCKET = 16
+    MAX_SPRITES = 48
+
+    def __init__(self):
+        self.sprites = OrderedDict()
+
+    def get(self, width, height, color):
+        bucket = -(-int(height) // self.HEIGHT_BUCKET) * self.HEIGHT_BUCKET
+        key = (width, bucket, color)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self._render(width, bucket, color)
+            self.sprites[key] = sprite
+            if len(self.sprites) > self.MAX_SPRITES:
+                self.sprites.popitem(last=False)
+        else:
+            self.sprites.move_to_end(key)
+        return sprite
+
+    def _render(self, width, height, color):
+        sprite = pygame.Surface((width, max(1, height)), pygame.SRCALPHA)
+        for i in range(width):
+            # Most opaque in the middle, fading out to both sides
+            strip_alpha = 200 - abs(i - width // 2) * 10
+            sprite.fill((*color, strip_alpha), (i, 0, 1, height))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+
+    def draw(self, surface, x, y, width, height, color):
+        surface.blit(self.get(width, height, color), (x, y), (0, 0, width, int(height)))
+
+
+gradient_columns = GradientColumns()  # Shared by all obstacles
 
 class Obstacle:
-    def __init__(self, screen_width, screen_height, obstacle_type=None):
+    def __init__(self, screen_width, screen_height, obstacle_type=None, rng=random, fx_rng=random, particles=None):
+        # rng drives the layout (gameplay), fx_rng only the particles and glitches
+        self.__fx_rng = fx_rng
         self.__width = 20
         self.__x = screen_width + 50  # Start off-screen right
+        self.__prev_x = self.__x  # Position before the last update, for interpolated drawing
         self.__color = (255, 50, 0)  # Base firewall color
-        self.__particles = []
+        self.__particles = particles  # Shared ParticlePool for the flames
 
         
 
         if obstacle_type is None:
-            obstacle_type = random.choice([0, 1, 2])  # 0: top, 1: bottom, 2: floating
+            obstacle_type = rng.choice([0, 1, 2])  # 0: top, 1: bottom, 2: floating
 
         if obstacle_type == 0:
             self.__y = 0
-            self.__height = random.randint(int(screen_height * 0.2), int(screen_height * 0.4))
+            self.__height = rng.randint(int(screen_height * 0.2), int(screen_height * 0.4))
             self.__type = "top"
         elif obstacle_type == 1:
-            self.__height = random.randint(int(screen_height * 0.2), int(screen_height * 0.4))
+            self.__height = rng.randint(int(screen_height * 0.2), int(screen_height * 0.4))
             self.__y = screen_height - self.__height
             self.__type = "bottom"
         else:
-            self.__height = random.randint(int(screen_height * 0.2), int(screen_height * 0.4))
-            self.__y = random.randint(int(screen_height/2 - self.__height*0.8), int(screen_height/2 - self.__height*0.3))            
+            self.__height = rng.randint(int(screen_height * 0.2), int(screen_height * 0.4))
+            self.__y = rng.randint(int(screen_height/2 - self.__height*0.8), int(screen_height/2 - self.__height*0.3))            
             self.__type = "floating"
 
 
-    def update(self, scroll_speed):
-        self.__x -= scroll_speed
-
-        # Update particles
-        for p in self.__particles[:]:
-            p['x'] += p['dx']
-            p['y'] += p['dy']
-            p['life'] -= 1
-            if p['life'] <= 0:
-                self.__particles.remove(p)
+    def update(self, scroll_speed, dt=1.0):
+        # Speeds are in pixels per 60 FPS frame, dt is the step length in those frames
+        self._move(scroll_speed, dt)
 
         # Generate flame particles
-        if random.random() < 0.3:
-            self.__particles.append({
-                'x': self.__x + random.randint(0, self.__width),
-                'y': self.__y + random.randint(0, self.__height),
-                'dx': random.uniform(-0.5, 0.5),
-                'dy': random.uniform(-0.5, 0.5),
-                'life': random.randint(10, 30),
-                'size': random.randint(1, 3)
-            })
-
-    def draw(self, surface):
+        if self.__fx_rng.random() < 0.3 * dt:
+            emit_flame(self.__particles, self.__fx_rng, self.__x, self.__y, self.__width, self.__height)
+
+    def _move(self, scroll_speed, dt):
+        # Position only, an entity store does this for all obstacles at once
+        self.__prev_x = self.__x
+        self.__x -= scroll_speed * dt
+
+    def draw(self, surface, alpha=1.0):
+        x = self.__prev_x + (self.__x - self.__prev_x) * alpha
+
         # Fiery obstacle
-        for i in range(self.__width):
-            alpha = 200 - abs(i - self.__width // 2) * 10
-            pygame.draw.rect(surface, (*self.__color, alpha),
-                                (self.__x + i, self.__y, 1, self.__height))
-
-        # Flame particles
-        for p in self.__particles:
-            alpha = min(255, p['life'] * 8)
-            pygame.draw.circle(
-                surface,
-                (255, random.randint(100, 200), 0, alpha),
-                (int(p['x']), int(p['y'])),
-                p['size']
-            )
+        gradient_columns.draw(surface, x, self.__y, self.__width, self.__height, self.__color)
 
         # Glitch effect
-        if random.random() < 0.1:
-            glitch_y = self.__y + random.randint(0, self.__height)
+        if self.__fx_rng.random() < 0.1:
+            glitch_y = self.__y + self.__fx_rng.randint(0, self.__height)
             pygame.draw.line(
                 surface, (0, 255, 0, 100),
-                (self.__x - 5, glitch_y),
-                (self.__x + self.__width + 5, glitch_y),
+                (x - 5, glitch_y),
+                (x + self.__width + 5, glitch_y),
                 1
             )
 
@@ -83,6 +111,8 @@ class Obstacle:
     def get_height(self): return self.__height
     def get_width(self): return self.__width
     def get_rect(self): return pygame.Rect(self.__x, self.__y, self.__width, self.__height)
+    def get_rects(self): return (self.get_rect(),)
+    def get_motion(self): return (self.__x - self.__prev_x, 0)
     def is_off_screen(self): return self.__x + self.__width < 0
     def get_type(self): return self.__type
 
@@ -91,15 +121,16 @@ class Obstacle:
 class PairedObstacle:
     GAP_HEIGHT = 100  # vertical gap between top and bottom obstacles
 
-    def __init__(self, screen_width, screen_height, lane_y_positions):
+    def __init__(self, screen_width, screen_height, lane_y_positions, rng=random, fx_rng=random, particles=None):
+        self.__fx_rng = fx_rng
         self.__width = 20
         self.__x = screen_width + 50
+        self.__prev_x = self.__x
         self.__color = (255, 50, 0)
-        self.__particles_top = []
-        self.__particles_bottom = []
+        self.__particles = particles
 
         # Choose a lane for the gap
-        gap_lane_index = random.randint(0, len(lane_y_positions) - 1)
+        gap_lane_index = rng.randint(0, len(lane_y_positions) - 1)
         gap_y = lane_y_positions[gap_lane_index]
 
         # Top obstacle bottom edge just above gap_y
@@ -110,96 +141,47 @@ class PairedObstacle:
         self.__bottom_y = gap_y + self.GAP_HEIGHT // 2
         self.__bottom_height = screen_height - self.__bottom_y
 
-    def update(self, scroll_speed):
-        self.__x -= scroll_speed
-
-        # Update particles top
-        for p in self.__particles_top[:]:
-            p['x'] += p['dx']
-            p['y'] += p['dy']
-            p['life'] -= 1
-            if p['life'] <= 0:
-                self.__particles_top.remove(p)
-
-        if random.random() < 0.3:
-            self.__particles_top.append({
-                'x': self.__x + random.randint(0, int(self.__width)),
-                'y': int(self.__top_y) + random.randint(0, int(self.__top_height)),
-                'dx': random.uniform(-0.5, 0.5),
-                'dy': random.uniform(-0.5, 0.5),
-                'life': random.randint(10, 30),
-                'size': random.randint(1, 3)
-            })
-
-        # Update particles bottom
-        for p in self.__particles_bottom[:]:
-            p['x'] += p['dx']
-            p['y'] += p['dy']
-            p['life'] -= 1
-            if p['life'] <= 0:
-                self.__particles_bottom.remove(p)
-
-        if random.random() < 0.3:
-            self.__particles_bottom.append({
-                'x': self.__x + random.randint(0, int(self.__width)),
-                'y': int(self.__bottom_y) + random.randint(0, int(self.__bottom_height)),
-                'dx': random.uniform(-0.5, 0.5),
-                'dy': random.uniform(-0.5, 0.5),
-                'life': random.randint(10, 30),
-                'size': random.randint(1, 3)
-            })
-
-    def draw(self, surface):
-        
+    def update(self, scroll_speed, dt=1.0):
+        self._move(scroll_speed, dt)
+
+        # Flame particles top
+        if self.__fx_rng.random() < 0.3 * dt:
+            emit_flame(self.__particles, self.__fx_rng, self.__x, int(self.__top_y), int(self.__width), int(self.__top_height))
+
+        # Flame particles bottom
+        if self.__fx_rng.random() < 0.3 * dt:
+            emit_flame(self.__particles, self.__fx_rng, self.__x, int(self.__bottom_y), int(self.__width), int(self.__bottom_height))
+
+    def _move(self, scroll_speed, dt):
+        self.__prev_x = self.__x
+        self.__x -= scroll_speed * dt
+
+    def draw(self, surface, alpha=1.0):
+        x = self.__prev_x + (self.__x - self.__prev_x) * alpha
+
         # Draw top obstacle (vertical bar)
-        for i in range(self.__width):
-            alpha = 200 - abs(i - self.__width // 2) * 10
-            pygame.draw.rect(surface, (*self.__color, alpha),
-                            (self.__x + i, self.__top_y, 1, self.__top_height))
+        gradient_columns.draw(surface, x, self.__top_y, self.__width, self.__top_height, self.__color)
 
         # Draw bottom obstacle
-        for i in range(self.__width):
-            alpha = 200 - abs(i - self.__width // 2) * 10
-            pygame.draw.rect(surface, (*self.__color, alpha),
-                            (self.__x + i, self.__bottom_y, 1, self.__bottom_height))
-
-        # Draw flame particles top
-        for p in self.__particles_top:
-            alpha = min(255, p['life'] * 8)
-            pygame.draw.circle(
-                surface,
-                (255, random.randint(100, 200), 0, alpha),
-                (int(p['x']), int(p['y'])),
-                p['size']
-            )
-
-        # Draw flame particles bottom
-        for p in self.__particles_bottom:
-            alpha = min(255, p['life'] * 8)
-            pygame.draw.circle(
-                surface,
-                (255, random.randint(100, 200), 0, alpha),
-                (int(p['x']), int(p['y'])),
-                p['size']
-            )
+        gradient_columns.draw(surface, x, self.__bottom_y, self.__width, self.__bottom_height, self.__color)
 
         # Glitch effect top
-        if random.random() < 0.1:
-            glitch_y = int(self.__top_y) + random.randint(0, int(self.__top_height))
+        if self.__fx_rng.random() < 0.1:
+            glitch_y = int(self.__top_y) + self.__fx_rng.randint(0, int(self.__top_height))
             pygame.draw.line(
                 surface, (0, 255, 0, 100),
-                (self.__x - 5, glitch_y),
-                (self.__x + self.__width + 5, glitch_y),
+                (x - 5, glitch_y),
+                (x + self.__width + 5, glitch_y),
                 1
             )
 
         # Glitch effect bottom
-        if random.random() < 0.1:
-            glitch_y = int(self.__bottom_y) + random.randint(0, int(self.__bottom_height))
+        if self.__fx_rng.random() < 0.1:
+            glitch_y = int(self.__bottom_y) + self.__fx_rng.randint(0, int(self.__bottom_height))
             pygame.draw.line(
                 surface, (0, 255, 0, 100),
-                (self.__x - 5, glitch_y),
-                (self.__x + self.__width + 5, glitch_y),
+                (x - 5, glitch_y),
+                (x + self.__width + 5, glitch_y),
                 1
             )
 
@@ -212,84 +194,69 @@ class PairedObstacle:
     def get_width(self): return self.__width
     def get_top_rect(self): return pygame.Rect(self.__x, self.__top_y, self.__width, self.__top_height)
     def get_bottom_rect(self): return pygame.Rect(self.__x, self.__bottom_y, self.__width, self.__bottom_height)
+    def get_rects(self): return (self.get_top_rect(), self.get_bottom_rect())
+    def get_motion(self): return (self.__x - self.__prev_x, 0)
     def is_off_screen(self): return self.__x + self.__width < 0
     
 class MovingObstacle:
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, rng=random, fx_rng=random, particles=None):
+        self.__fx_rng = fx_rng
         self.__width = 20
-        self.__height = random.randint(int(screen_height * 0.075), int(screen_height * 0.125))
+        self.__height = rng.randint(int(screen_height * 0.075), int(screen_height * 0.125))
         self.__x = screen_width + 50
+        self.__prev_x = self.__x
         self.__oscillate_time = 0
-        self.__speed = random.uniform(0.02, 0.045)
+        self.__speed = rng.uniform(0.02, 0.045)
         self.__type = "oscillating"
         self.__color = (255, 50, 0)
-        self.__particles = []
+        self.__particles = particles  # Shared ParticlePool for the flames
 
         # Lane setup
         lanes = [screen_height * 0.1, screen_height * 0.5, screen_height * 0.9]
 
         # Choose amplitude and determine base_y from center of lane(s)
-        self.__amplitude = random.choice([150, 150, 270, 380])
+        self.__amplitude = rng.choice([150, 150, 270, 380])
 
         if self.__amplitude == 150:
             # Small amplitude → just oscillate around one lane
-            self.__base_y = random.choice(lanes)
+            self.__base_y = rng.choice(lanes)
         elif self.__amplitude == 270:
             # Medium → between two lanes
             pairs = [(lanes[0], lanes[1]), (lanes[1], lanes[2])]
-            low, high = random.choice(pairs)
+            low, high = rng.choice(pairs)
             self.__base_y = ((low + high) // 2)
         else:
             # Large amplitude → center between top and bottom lanes
             self.__base_y = ((lanes[0] + lanes[2]) // 2)
 
         self.__y = self.__base_y - (self.__height/2)
+        self.__prev_y = self.__y
+
+    def update(self, scroll_speed, dt=1.0):
+        self._move(scroll_speed, dt)
+
+        if self.__fx_rng.random() < 0.3 * dt:
+            emit_flame(self.__particles, self.__fx_rng, self.__x, self.__y, self.__width, int(self.__height))
 
-    def update(self, scroll_speed):
-        self.__x -= scroll_speed
-        self.__oscillate_time += 1
+    def _move(self, scroll_speed, dt):
+        self.__prev_x = self.__x
+        self.__prev_y = self.__y
+        self.__x -= scroll_speed * dt
+        self.__oscillate_time += dt
         self.__y = self.__base_y + math.sin(self.__oscillate_time * self.__speed) * self.__amplitude
 
-        # Update particles
-        for p in self.__particles[:]:
-            p['x'] += p['dx']
-            p['y'] += p['dy']
-            p['life'] -= 1
-            if p['life'] <= 0:
-                self.__particles.remove(p)
-
-        if random.random() < 0.3:
-            self.__particles.append({
-                'x': self.__x + random.randint(0, self.__width),
-                'y': self.__y + random.randint(0, int(self.__height)),
-                'dx': random.uniform(-0.5, 0.5),
-                'dy': random.uniform(-0.5, 0.5),
-                'life': random.randint(10, 30),
-                'size': random.randint(1, 3)
-            })
-
-    def draw(self, surface):
-        
-        for i in range(self.__width):
-            alpha = 200 - abs(i - self.__width // 2) * 10
-            pygame.draw.rect(surface, (*self.__color, alpha),
-                            (self.__x + i, int(self.__y), 1, self.__height))
-
-        for p in self.__particles:
-            alpha = min(255, p['life'] * 8)
-            pygame.draw.circle(
-                surface,
-                (255, random.randint(100, 200), 0, alpha),
-                (int(p['x']), int(p['y'])),
-                p['size']
-            )
+    def draw(self, surface, alpha=1.0):
+        x = self.__prev_x + (self.__x - self.__prev_x) * alpha
+        y = self.__prev_y + (self.__y - self.__prev_y) * alpha
+
+        gradient_columns.draw(surface, x, int(y), self.__width, self.__height, self.__color)
 
-        if random.random() < 0.1:
-            glitch_y = int(self.__y) + random.randint(0, int(self.__height))
+        if self.__fx_rng.random() < 0.1:
+            glitch_y = int(y) + self.__fx_rng.randint(0, int(self.__height))
             pygame.draw.line(
                 surface, (0, 255, 0, 100),
-                (self.__x - 5, glitch_y),
-                (self.__x + self.__width + 5, glitch_y),
+                (x - 5, glitch_y),
+                (x + self.__width + 5, glitch_y),
                 1
             )
 
@@ -301,4 +268,6 @@ class MovingObstacle:
     def is_off_screen(self): return self.__x + self.__width < 0
     def get_type(self): return self.__type
     def get_rect(self): return pygame.Rect(self.__x, self.__y, self.__width, self.__height)
+    def get_rects(self): return (self.get_rect(),)
+    def get_motion(self): return (self.__x - self.__prev_x, self.__y - self.__prev_y)
     def is_off_screen(self): return self.__x + self.__width < 0
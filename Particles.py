@@ -0,0 +1,172 @@
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # Falls back to plain lists, same layout and API
+    np = None
+
+# Particle kinds, they decide the colour and fade
+FLAME = 0  # Obstacle flames
+VIRUS_TRAIL = 1
+
+# Pre-rendered sprites: every kind, radius, shade and life bucket a particle can be drawn with
+MAX_SIZE = 4
+MAX_LIFE = 30  # Life at which a particle is drawn at full strength
+LIFE_BUCKETS = 8
+FLAME_SHADES = (100, 125, 150, 175, 200)  # Green channel of the flames, picked per particle to flicker
+SHADES = len(FLAME_SHADES)
+
+COLUMNS = ("x", "y", "dx", "dy", "life", "size", "scroll", "kind")  # x, y, dx, dy first, updated as a block
+
+
+class ParticlePool:
+    """Every particle in the game in fixed-capacity arrays, one column per field.
+
+    Dead particles are swap-removed (the last live particle moves into the
+    hole), so the live ones are always the first `count` entries. The
+    capacity is the global particle budget: emits beyond it are dropped.
+    """
+    DEFAULT_CAPACITY = 1024
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        if np is not None:
+            # One row per column, so a swap-remove moves a whole particle in one go
+            self.data = np.zeros((len(COLUMNS), capacity))
+            columns = self.data
+        else:
+            columns = [[0.0] * capacity for _ in COLUMNS]
+        for name, column in zip(COLUMNS, columns):
+            setattr(self, name, column)
+        self.count = 0
+        self.dropped = 0  # Emits refused because the budget was full
+
+    def emit(self, kind, x, y, dx, dy, life, size, scroll=0.0):
+        """Add a particle; scroll is the share of the scroll speed it drifts left with"""
+        i = self.count
+        if i == self.capacity:
+            self.dropped += 1
+            return False
+        self.x[i] = x
+        self.y[i] = y
+        self.dx[i] = dx
+        self.dy[i] = dy
+        self.life[i] = life
+        self.size[i] = size
+        self.scroll[i] = scroll
+        self.kind[i] = kind
+        self.count = i + 1
+        return True
+
+    def update(self, scroll_speed, dt=1.0):
+        if np is not None:
+            self._update_arrays(scroll_speed, dt)
+        else:
+            self._update_lists(scroll_speed, dt)
+
+    def _update_arrays(self, scroll_speed, dt):
+        n = self.count
+        if not n:
+            return
+        data = self.data
+        data[0:2, :n] += data[2:4, :n] * dt  # x and y by dx and dy
+        self.x[:n] -= self.scroll[:n] * (scroll_speed * dt)
+        life = self.life[:n]
+        life -= dt
+
+        dead = np.flatnonzero(life <= 0)
+        if not len(dead):
+            return
+        # Swap-remove in one go: the holes below the new count take the live particles above it
+        new_count = n - len(dead)
+        holes = dead[dead < new_count]
+        if len(holes):
+            movers = new_count + np.flatnonzero(life[new_count:] > 0)
+            data[:, holes] = data[:, movers]
+        self.count = new_count
+
+    def _update_lists(self, scroll_speed, dt):
+        x, y, dx, dy, life, scroll = self.x, self.y, self.dx, self.dy, self.life, self.scroll
+        i = 0
+        while i < self.count:
+            life[i] -= dt
+            if life[i] <= 0:
+                last = self.count - 1
+                for name in COLUMNS:
+                    column = getattr(self, name)
+                    column[i] = column[last]
+                self.count = last
+                continue  # The particle moved in from the end still needs its update
+            x[i] += (dx[i] - scroll[i] * scroll_speed) * dt
+            y[i] += dy[i] * dt
+            i += 1
+
+    def clear(self):
+        self.count = 0
+
+    def draw(self, surface, fx_rng):
+        """All particles in one additive blits() call"""
+        n = self.count
+        if not n:
+            return
+        sprites = _baked_sprites()
+        shift = fx_rng.randrange(SHADES)  # Moves every flame to another shade each frame
+        if np is not None:
+            size = self.size[:n].astype(int)
+            life = np.minimum(LIFE_BUCKETS - 1, (self.life[:n] * (LIFE_BUCKETS / MAX_LIFE)).astype(int))
+            shade = (np.arange(n) + shift) % SHADES
+            keys = (((self.kind[:n].astype(int) * (MAX_SIZE + 1) + size) * SHADES + shade) * LIFE_BUCKETS + life).tolist()
+            xs = (self.x[:n] - size).astype(int).tolist()
+            ys = (self.y[:n] - size).astype(int).tolist()
+        else:
+            keys, xs, ys = [], [], []
+            for i in range(n):
+                size = int(self.size[i])
+                life = min(LIFE_BUCKETS - 1, int(self.life[i] * (LIFE_BUCKETS / MAX_LIFE)))
+                keys.append(((int(self.kind[i]) * (MAX_SIZE + 1) + size) * SHADES + (i + shift) % SHADES) * LIFE_BUCKETS + life)
+                xs.append(int(self.x[i] - size))
+                ys.append(int(self.y[i] - size))
+        surface.blits([(sprites[key], (x, y), None, pygame.BLEND_ADD) for key, x, y in zip(keys, xs, ys)],
+                      doreturn=False)
+
+    def __len__(self):
+        return self.count
+
+
+_sprites = None
+
+
+def _baked_sprites():
+    """Flat list of circle sprites indexed like the keys in ParticlePool.draw, baked on first use.
+
+    Drawn additively, so each sprite is its colour already multiplied by its
+    alpha on black, and black adds nothing around the circle.
+    """
+    global _sprites
+    if _sprites is None:
+        _sprites = []
+        for kind in (FLAME, VIRUS_TRAIL):
+            for size in range(MAX_SIZE + 1):
+                for shade in FLAME_SHADES:
+                    color = (255, shade, 0) if kind == FLAME else (255, 100, 100)
+                    for bucket in range(LIFE_BUCKETS):
+                        life = (bucket + 0.5) * MAX_LIFE / LIFE_BUCKETS
+                        alpha = min(255, life * 8) if kind == FLAME else 255 * life / MAX_LIFE
+                        sprite = pygame.Surface((size * 2 + 1, size * 2 + 1))
+                        if size:
+                            pygame.draw.circle(sprite, [int(c * alpha / 255) for c in color], (size, size), size)
+                        _sprites.append(sprite)
+    return _sprites
+
+
+def emit_flame(pool, fx_rng, x, y, width, height):
+    """A flame particle somewhere on a firewall bar"""
+    if pool is None:
+        return
+    pool.emit(FLAME,
+              x + fx_rng.randint(0, width),
+              y + fx_rng.randint(0, height),
+              fx_rng.uniform(-0.5, 0.5),
+              fx_rng.uniform(-0.5, 0.5),
+              fx_rng.randint(10, 30),
+              fx_rng.randint(1, 3))
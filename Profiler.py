@@ -0,0 +1,222 @@
+import pygame
+import json
+import os
+import time
+from array import array
+from collections import deque
+from Manager import data_dir
+
+PACING_DIR = os.path.join(data_dir, "pacing")
+MAX_SAVED_SESSIONS = 50
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class NullProfiler:
+    """Stands in when profiling is off, so instrumented code costs next to nothing"""
+    enabled = False
+    _stage = _NullStage()
+
+    def stage(self, name):
+        return self._stage
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class _StageTimer:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        times = self.profiler.current
+        times[self.name] = times.get(self.name, 0) + (time.perf_counter() - self.start) * 1000
+        return False
+
+
+class FrameProfiler:
+    """Times named stages of each frame and draws them as a rolling overlay (F3)"""
+    HISTORY = 180  # frames kept for averages and the graph
+    BUDGET_MS = 1000 / 60
+    GRAPH_WIDTH = 360
+    GRAPH_HEIGHT = 100
+    GRAPH_MAX_MS = 2 * BUDGET_MS
+    TEXT_REFRESH = 15  # frames between number updates, so the overlay stays readable and cheap
+    COLORS = [(0, 255, 0), (0, 200, 255), (255, 200, 0), (255, 80, 80), (200, 100, 255),
+              (255, 150, 0), (0, 255, 180), (255, 0, 180), (180, 180, 180), (120, 255, 120),
+              (100, 150, 255), (255, 255, 120)]
+
+    def __init__(self, font):
+        self.font = font
+        self.enabled = False
+        self.stages = []  # Stage names in first-seen order
+        self.timers = {}
+        self.history = {}
+        self.frame_history = deque(maxlen=self.HISTORY)
+        self.current = {}
+        self.frame_start = 0
+        self.frame_count = 0
+
+        self.graph = pygame.Surface((self.GRAPH_WIDTH, self.GRAPH_HEIGHT), pygame.SRCALPHA)
+        self.text_lines = []
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.graph.fill((0, 0, 0, 0))
+
+    def stage(self, name):
+        if not self.enabled:
+            return NULL_PROFILER.stage(name)
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = _StageTimer(self, name)
+            self.stages.append(name)
+            self.history[name] = deque(maxlen=self.HISTORY)
+        return timer
+
+    def begin_frame(self):
+        self.current = {}
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Close the frame's timings (call before drawing the overlay so it isn't measured)"""
+        if not self.enabled:
+            return
+        frame_ms = (time.perf_counter() - self.frame_start) * 1000
+        self.frame_history.append(frame_ms)
+        for name in self.stages:
+            self.history[name].append(self.current.get(name, 0))
+        self.frame_count += 1
+        self._add_graph_column()
+
+    def _add_graph_column(self):
+        column = 2
+        self.graph.scroll(-column, 0)
+        self.graph.fill((0, 0, 0, 160), (self.GRAPH_WIDTH - column, 0, column, self.GRAPH_HEIGHT))
+
+        scale = self.GRAPH_HEIGHT / self.GRAPH_MAX_MS
+        y = self.GRAPH_HEIGHT
+        for i, name in enumerate(self.stages):
+            height = self.current.get(name, 0) * scale
+            if height <= 0:
+                continue
+            top = max(0, y - height)
+            self.graph.fill(self.COLORS[i % len(self.COLORS)],
+                            (self.GRAPH_WIDTH - column, int(top), column, max(1, int(y) - int(top))))
+            y = top
+
+        budget_y = self.GRAPH_HEIGHT - int(self.BUDGET_MS * scale)
+        self.graph.fill((255, 255, 255), (self.GRAPH_WIDTH - column, budget_y, column, 1))
+
+    def _render_text(self, counts):
+        lines = []
+        if self.frame_history:
+            frames = list(self.frame_history)
+            lines.append((f"FRAME {sum(frames) / len(frames):6.2f} ms avg {max(frames):6.2f} max", (255, 255, 255)))
+        for i, name in enumerate(self.stages):
+            values = self.history[name]
+            average = sum(values) / len(values) if values else 0
+            peak = max(values) if values else 0
+            lines.append((f"{name:<16}{average:6.2f} ms avg {peak:6.2f} max", self.COLORS[i % len(self.COLORS)]))
+        if counts:
+            lines.append(("  ".join(f"{name}:{value}" for name, value in counts.items()), (200, 200, 200)))
+        self.text_lines = [self.font.render(text, True, color) for text, color in lines]
+
+    def draw(self, surface, counts=None):
+        """Draw the overlay, counts is an optional {label: number} line (entities, particles)"""
+        if not self.enabled:
+            return
+        if self.frame_count % self.TEXT_REFRESH == 1 or not self.text_lines:
+            self._render_text(counts)
+
+        line_height = self.font.get_linesize()
+        panel_height = self.GRAPH_HEIGHT + 8 + line_height * len(self.text_lines) + 8
+        panel_width = max([self.GRAPH_WIDTH] + [line.get_width() for line in self.text_lines]) + 16
+        x = 10
+        y = surface.get_height() - panel_height - 10
+
+        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        surface.blit(panel, (x, y))
+        surface.blit(self.graph, (x + 8, y + 8))
+
+        text_y = y + self.GRAPH_HEIGHT + 16
+        for line in self.text_lines:
+            surface.blit(line, (x + 8, text_y))
+            text_y += line_height
+
+
+class FramePacing:
+    """Every frame time of a session, grouped by game state, for stutter statistics"""
+    BUDGET_MS = 1000 / 60
+    TOLERANCE_MS = 2  # Vsync and timer jitter that doesn't count as a missed frame
+
+    def __init__(self):
+        self.frames = {}  # state -> array of frame times in ms
+        self.stall = {}  # state -> ms of the current run of over-budget frames
+        self.longest_stall = {}
+        self.over_budget = {}
+        self.path = os.path.join(PACING_DIR, time.strftime("session_%Y%m%d_%H%M%S.json"))
+
+    def record(self, state, frame_ms):
+        if state not in self.frames:
+            self.frames[state] = array("f")
+            self.stall[state] = 0
+            self.longest_stall[state] = 0
+            self.over_budget[state] = 0
+        self.frames[state].append(frame_ms)
+
+        if frame_ms > self.BUDGET_MS + self.TOLERANCE_MS:
+            self.over_budget[state] += 1
+            self.stall[state] += frame_ms
+            self.longest_stall[state] = max(self.longest_stall[state], self.stall[state])
+        else:
+            self.stall[state] = 0
+
+    def summary(self):
+        """{state: {frames, p50, p95, p99, max, over_budget, longest_stall}}, times in ms"""
+        result = {}
+        for state, frames in self.frames.items():
+            ordered = sorted(frames)
+            count = len(ordered)
+            result[state] = {
+                "frames": count,
+                "p50": ordered[int(0.50 * (count - 1))],
+                "p95": ordered[int(0.95 * (count - 1))],
+                "p99": ordered[int(0.99 * (count - 1))],
+                "max": ordered[-1],
+                "over_budget": self.over_budget[state],
+                "longest_stall": self.longest_stall[state],
+            }
+        return result
+
+    def summary_lines(self):
+        lines = ["STATE        FRAMES   P50   P95   P99   MAX  OVER  STALL"]
+        for state, stats in self.summary().items():
+            lines.append(f"{state:<12}{stats['frames']:>7}{stats['p50']:>6.1f}{stats['p95']:>6.1f}"
+                         f"{stats['p99']:>6.1f}{stats['max']:>6.0f}{stats['over_budget']:>6}"
+                         f"{stats['longest_stall']:>7.0f}")
+        return lines
+
+    def save(self):
+        """Write the summary to this session's file, keeping only the newest sessions"""
+        os.makedirs(PACING_DIR, exist_ok=True)
+        with open(self.path, "w") as file:
+            json.dump({"budget_ms": self.BUDGET_MS, "states": self.summary()}, file, indent=4)
+
+        saved = sorted(f for f in os.listdir(PACING_DIR) if f.endswith(".json"))
+        for old_file in saved[:-MAX_SAVED_SESSIONS]:
+            os.remove(os.path.join(PACING_DIR, old_file))
+        return self.path
@@ -0,0 +1,113 @@
+import os
+import struct
+import time
+from Manager import data_dir
+
+# Replay file layout (little endian):
+#   header: magic, format version, tick rate, run seed, number of runs, game mode flags
+#   body:   one (W/A/S/D bitmask, tick count) pair per run of identical input
+# Version 1 files have no flags byte.
+REPLAY_MAGIC = b"HKLR"
+REPLAY_VERSION = 2
+HEADER_FORMAT = "<4sBHQIB"
+HEADER_FORMAT_V1 = "<4sBHQI"
+RUN_FORMAT = "<BH"
+MAX_RUN_LENGTH = 0xFFFF  # Longer runs are split
+
+REPLAY_FLAG_OVERCLOCK = 1  # Played on the overclock speed tier
+REPLAY_FLAG_ENTITY_STORE = 2  # Positions were updated by the NumPy entity store
+
+REPLAY_DIR = os.path.join(data_dir, "replays")
+MAX_SAVED_REPLAYS = 50
+
+
+class InputRecorder:
+    """Run-length encodes one input bitmask per simulation tick"""
+
+    def __init__(self):
+        self.runs = []  # [bits, count] pairs
+        self.tick_count = 0
+
+    def record(self, bits):
+        if self.runs and self.runs[-1][0] == bits and self.runs[-1][1] < MAX_RUN_LENGTH:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([bits, 1])
+        self.tick_count += 1
+
+    def save(self, path, seed, tick_rate, flags=0):
+        with open(path, "wb") as file:
+            file.write(struct.pack(HEADER_FORMAT, REPLAY_MAGIC, REPLAY_VERSION, tick_rate, seed, len(self.runs), flags))
+            file.write(b"".join(struct.pack(RUN_FORMAT, bits, count) for bits, count in self.runs))
+
+
+class Replay:
+    """A recorded run: its seed, tick rate, game mode flags and per-tick inputs"""
+
+    def __init__(self, seed, tick_rate, runs, flags=0):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.runs = runs
+        self.flags = flags
+        self.tick_count = sum(count for _, count in runs)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            data = file.read()
+
+        header_size = struct.calcsize(HEADER_FORMAT_V1)
+        if len(data) < header_size:
+            raise ValueError(f"{path} is not a replay file")
+        magic, version, tick_rate, seed, run_count = struct.unpack_from(HEADER_FORMAT_V1, data)
+        if magic != REPLAY_MAGIC or version not in (1, REPLAY_VERSION):
+            raise ValueError(f"{path} is not a version 1-{REPLAY_VERSION} replay file")
+
+        flags = 0
+        if version >= 2:
+            header_size = struct.calcsize(HEADER_FORMAT)
+            flags = struct.unpack_from(HEADER_FORMAT, data)[5]
+
+        runs = [list(run) for run in struct.iter_unpack(RUN_FORMAT, data[header_size:])]
+        if len(runs) != run_count:
+            raise ValueError(f"{path} is truncated")
+        return cls(seed, tick_rate, runs, flags)
+
+    def player(self):
+        return ReplayPlayer(self)
+
+
+class ReplayPlayer:
+    """Hands out a replay's inputs one tick at a time"""
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.run_index = 0
+        self.used_in_run = 0
+        self.tick = 0
+        self.finished = replay.tick_count == 0
+
+    def next_bits(self):
+        if self.finished:
+            return 0
+        bits, count = self.replay.runs[self.run_index]
+        self.used_in_run += 1
+        self.tick += 1
+        if self.used_in_run >= count:
+            self.run_index += 1
+            self.used_in_run = 0
+            self.finished = self.run_index >= len(self.replay.runs)
+        return bits
+
+
+def save_run(recorder, seed, tick_rate, flags=0):
+    """Save a finished run into the replay folder, keeping only the newest ones"""
+    os.makedirs(REPLAY_DIR, exist_ok=True)
+    file_name = time.strftime("run_%Y%m%d_%H%M%S") + f"_{seed}.hlr"
+    path = os.path.join(REPLAY_DIR, file_name)
+    recorder.save(path, seed, tick_rate, flags)
+
+    saved = sorted(f for f in os.listdir(REPLAY_DIR) if f.endswith(".hlr"))
+    for old_file in saved[:-MAX_SAVED_REPLAYS]:
+        os.remove(os.path.join(REPLAY_DIR, old_file))
+    return path
@@ -1,11 +1,62 @@
 import pygame
 import random
-from Customisations import skins, trails
+from Customisations import skins, trails, skin_renderer
+
+
+class TrailBuffer:
+    """Fixed-size ring of points kept in world space (screen x plus the distance scrolled).
+
+    Scrolling only moves the offset, so no point has to be touched when the
+    screen scrolls, and a new point overwrites the oldest once the ring is full.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.clear()
+
+    def clear(self):
+        self.start = 0  # Oldest point
+        self.count = 0
+        self.offset = 0.0  # Distance scrolled since the last clear
+
+    def scroll(self, distance):
+        self.offset += distance
+
+    def append(self, point):
+        i = (self.start + self.count) % self.capacity
+        self.xs[i] = point[0] + self.offset
+        self.ys[i] = point[1]
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def last(self):
+        i = (self.start + self.count - 1) % self.capacity
+        return (self.xs[i] - self.offset, self.ys[i])
+
+    def points(self):
+        """Screen positions, oldest first"""
+        end = self.start + self.count
+        wrapped = max(0, end - self.capacity)
+        xs = self.xs[self.start:end] + self.xs[:wrapped]
+        ys = self.ys[self.start:end] + self.ys[:wrapped]
+        offset = self.offset
+        return [(x - offset, y) for x, y in zip(xs, ys)]
+
+    def __len__(self):
+        return self.count
+
 
 class Robot:
-    def __init__(self, x, y, width, height):
+    def __init__(self, x, y, width, height, fx_rng=random):
+        self.fx_rng = fx_rng  # Trail particles and glitch effect only
         self.__x_coord = float(x)
         self.__y_coord = float(y)
+        self.__prev_x_coord = self.__x_coord  # Position at the start of the last update, for interpolated drawing
+        self.__prev_y_coord = self.__y_coord
         self.__width = width
         self.__height = height
         self.__color = (255, 255, 255)
@@ -32,13 +83,14 @@ class Robot:
         self.dash_direction = 0  # -1 for left, 1 for right, 0 no dash
 
         #trail variables
-        self.trail_positions = []
+        self.trail_length = 60  # Max number of trail points
+        self.trail_positions = TrailBuffer(self.trail_length)
         self._last_trail_pos = None
         self._just_interpolated = False
 
         # Particle variables
-        self.active_particles = []
         self.max_particles = 10  # Reduced max particles
+        self.active_particles = TrailBuffer(self.max_particles)
         self.particle_spawn_chance_normal = 0.05 # 5% chance during normal movement interpolation
         self.particle_spawn_chance_segment = 0.3 # 30% chance per step during segment interpolation (dashes/lane switches)
 
@@ -46,31 +98,22 @@ class Robot:
     def get_rect(self):
         return pygame.Rect(self.__x_coord, self.__y_coord, self.__width, self.__height)
 
-    def draw(self, surface):
-        now = pygame.time.get_ticks()
+    def draw(self, surface, current_time=None, alpha=1.0):
+        now = pygame.time.get_ticks() if current_time is None else current_time
+        x = self.__prev_x_coord + (self.__x_coord - self.__prev_x_coord) * alpha
+        y = self.__prev_y_coord + (self.__y_coord - self.__prev_y_coord) * alpha
 
         # 1. Draw the main line trail with fading
         if self.trail and len(self.trail_positions) > 1 and self.trail.get_color() is not None:
-            points = self.trail_positions
-            n = len(points)
-            base_color = self.trail.get_color()
-            for i in range(n - 1):
-                fade = (i + 1) / n
-                color = (
-                    int(base_color[0] * fade),
-                    int(base_color[1] * fade),
-                    int(base_color[2] * fade)
-                )
-                pygame.draw.line(surface, color, points[i], points[i + 1], 4)
+            self.trail.draw_line(surface, self.trail_positions.points())
 
-        # 2. Draw particles using the trail's effect_function
+        # 2. Draw particles using the trail's effect sprite
         if self.trail and self.trail.name != "None":
-            for particle_pos in self.active_particles:
-                self.trail.draw_trail(surface, particle_pos)
+            self.trail.draw_particles(surface, self.active_particles.points())
 
         # 3. Draw robot skin
-        rect = pygame.Rect(self.__x_coord, self.__y_coord, self.__width, self.__height)
-        self.skin.draw_robot(surface, rect, self.skin)
+        rect = pygame.Rect(x, y, self.__width, self.__height)
+        self.skin.draw_robot(surface, rect, self.skin, now)
 
         # 4. Draw glitch effect (existing logic)
         if self.glitch_active:
@@ -79,29 +122,29 @@ class Robot:
             self.last_glitch_tick = now
 
             for _ in range(5):
-                offset_x = random.randint(-5, 5)
-                offset_y = random.randint(-5, 5)
+                offset_x = self.fx_rng.randint(-5, 5)
+                offset_y = self.fx_rng.randint(-5, 5)
                 glitch_rect = pygame.Rect(
-                    self.__x_coord + offset_x,
-                    self.__y_coord + offset_y,
+                    x + offset_x,
+                    y + offset_y,
                     self.__width,
                     self.__height,
                 )
-                glitch_color = random.choice([(0, 255, 255), (0, 255, 0), (255, 0, 255)])
+                glitch_color = self.fx_rng.choice([(0, 255, 255), (0, 255, 0), (255, 0, 255)])
                 pygame.draw.rect(surface, glitch_color, glitch_rect, 1)
 
-            pygame.draw.rect(surface, self.__color, self.get_rect())
+            pygame.draw.rect(surface, self.__color, rect)
 
             if self.glitch_timer <= 0:
                 self.glitch_active = False
 
-    def start_glitch(self):
+    def start_glitch(self, current_time=None):
         self.glitch_active = True
         self.glitch_timer = self.glitch_duration
-        self.last_glitch_tick = pygame.time.get_ticks()
+        self.last_glitch_tick = pygame.time.get_ticks() if current_time is None else current_time
 
-    def try_dash(self, direction, screenWidth):
-        now = pygame.time.get_ticks()
+    def try_dash(self, direction, screenWidth, current_time=None):
+        now = pygame.time.get_ticks() if current_time is None else current_time
         time_since_last_dash = now - self.last_dash_time
 
         if not self.dashing and (time_since_last_dash >= self.dash_cooldown) :
@@ -120,15 +163,20 @@ class Robot:
                 else:
                     self.dash_direction = 1
                     self.dash_target = self.__x_coord + self.dash_distance
-            self.start_glitch()
+            self.start_glitch(now)
             return True
         return False
 
-    def update_dash(self):
+    def store_previous_position(self):
+        # Called at the start of every fixed update so draw() can interpolate
+        self.__prev_x_coord = self.__x_coord
+        self.__prev_y_coord = self.__y_coord
+
+    def update_dash(self, dt=1.0):
         if self.dashing:
             old_center = (self.__x_coord + self.__width // 2, self.__y_coord + self.__height // 2)
 
-            self.__x_coord += self.dash_speed * self.dash_direction
+            self.__x_coord += self.dash_speed * self.dash_direction * dt
             
             new_center = (self.__x_coord + self.__width // 2, self.__y_coord + self.__height // 2)
             self.add_trail_segment(old_center, new_center, steps=3)
@@ -142,21 +190,22 @@ class Robot:
         elif self.returning:
             if (self.dash_direction == 1 and self.__x_coord > self.original_x) or \
                (self.dash_direction == -1 and self.__x_coord < self.original_x):
-                self.__x_coord -= self.return_speed * self.dash_direction
+                self.__x_coord -= self.return_speed * self.dash_direction * dt
 
                 if (self.dash_direction == 1 and self.__x_coord <= self.original_x) or \
                    (self.dash_direction == -1 and self.__x_coord >= self.original_x):
                     self.__x_coord = self.original_x
                     self.returning = False
 
-    def get_dash_cooldown_ratio(self):
-        now = pygame.time.get_ticks()
+    def get_dash_cooldown_ratio(self, current_time=None):
+        now = pygame.time.get_ticks() if current_time is None else current_time
         time_since_dash = now - self.last_dash_time
         return min(time_since_dash / self.dash_cooldown, 1.0)
 
     def reset(self, x, y):
         self.__x_coord = float(x)
         self.__y_coord = float(y)
+        self.store_previous_position()
         self.glitch_active = False
         self.glitch_timer = 0
         self.last_glitch_tick = 0
@@ -165,8 +214,8 @@ class Robot:
         self.last_dash_time = 0
         self.original_x = x
         self.dash_direction = 0
-        self.trail_positions = []
-        self.active_particles = []
+        self.trail_positions.clear()
+        self.active_particles.clear()
 
     def move(self, dx, dy):
         self.__x_coord += dx
@@ -176,11 +225,9 @@ class Robot:
         center = (self.__x_coord + self.__width // 2, self.__y_coord + self.__height // 2)
         if self._just_interpolated:
             self.trail_positions.append(center)
-            if len(self.trail_positions) > 60:
-                self.trail_positions.pop(0)
             self._just_interpolated = False
         elif self.trail_positions:
-            last = self.trail_positions[-1]
+            last = self.trail_positions.last()
             dist = ((center[0] - last[0]) ** 2 + (center[1] - last[1]) ** 2) ** 0.5
             if dist > 5:
                 steps = int(dist // 5)
@@ -188,27 +235,20 @@ class Robot:
                     interp_x = last[0] + (center[0] - last[0]) * i / steps
                     interp_y = last[1] + (center[1] - last[1]) * i / steps
                     self.trail_positions.append((interp_x, interp_y))
-                    if len(self.trail_positions) > 60:
-                        self.trail_positions.pop(0)
                     
                     # Particle spawning based on new chance
-                    if self.trail and self.trail.name != "None" and random.random() < self.particle_spawn_chance_normal:
+                    if self.trail and self.trail.name != "None" and self.fx_rng.random() < self.particle_spawn_chance_normal:
                         self.active_particles.append((interp_x, interp_y))
             else:
                 self.trail_positions.append(center)
-                if len(self.trail_positions) > 60:
-                    self.trail_positions.pop(0)
                 # Particle spawning for small movements
-                if self.trail and self.trail.name != "None" and random.random() < (self.particle_spawn_chance_normal / 2): # Halve chance for small movements
+                if self.trail and self.trail.name != "None" and self.fx_rng.random() < (self.particle_spawn_chance_normal / 2): # Halve chance for small movements
                     self.active_particles.append(center)
         else:
             self.trail_positions.append(center)
             if self.trail and self.trail.name != "None":
                 self.active_particles.append(center)
 
-        while len(self.active_particles) > self.max_particles:
-            self.active_particles.pop(0)
-
         self._last_trail_pos = center
 
     def add_trail_segment(self, old_center, new_center, steps=10):
@@ -216,26 +256,18 @@ class Robot:
             interp_x = old_center[0] + (new_center[0] - old_center[0]) * i / steps
             interp_y = old_center[1] + (new_center[1] - old_center[1]) * i / steps
             self.trail_positions.append((interp_x, interp_y))
-            if len(self.trail_positions) > 60:
-                self.trail_positions.pop(0)
             
             # Particle spawning based on new chance for segments
-            if self.trail and self.trail.name != "None" and random.random() < self.particle_spawn_chance_segment:
+            if self.trail and self.trail.name != "None" and self.fx_rng.random() < self.particle_spawn_chance_segment:
                 self.active_particles.append((interp_x, interp_y))
 
-        while len(self.active_particles) > self.max_particles:
-            self.active_particles.pop(0)
-
         self._last_trail_pos = new_center
         self._just_interpolated = True
 
     def update_trail_for_scroll(self, scroll_speed):
-        self.trail_positions = [
-            (x - scroll_speed, y) for (x, y) in self.trail_positions
-        ]
-        self.active_particles = [
-            (x - scroll_speed, y) for (x, y) in self.active_particles
-        ]
+        # Both rings are in world space, only their offset moves
+        self.trail_positions.scroll(scroll_speed)
+        self.active_particles.scroll(scroll_speed)
 
     # Setters
     def set_x_coord(self, x_coord):
@@ -250,6 +282,10 @@ class Robot:
     def set_color(self, r, g, b):
         self.__color = (r, g, b)
 
+    def set_trail_length(self, trail_length):
+        self.trail_length = trail_length
+        self.trail_positions = TrailBuffer(trail_length)
+
     def set_width(self, width):
         self.__width = width
 
@@ -258,6 +294,8 @@ class Robot:
         
     def set_skin(self, skin_name):
         self.skin = next((s for s in skins if s.name == skin_name), None)
+        if self.skin is not None:
+            skin_renderer.prepare(self.skin, self.__width, self.__height)  # Bake now rather than on the first frame
 
     def set_trail(self, trail_name):
         self.trail = next((t for t in trails if t.name == trail_name), None)
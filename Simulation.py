@@ -0,0 +1,609 @@
+import pygame
+import math
+import random
+import sys
+import time
+from Robot import Robot
+from Coin import Coin, KeyCollectible, GlitchCollectible
+from InGameThings import PortalSystem
+from Collision import ScrollingIndex, swept_collide
+from Particles import ParticlePool
+import Entities
+from Replay import InputRecorder
+from Profiler import NULL_PROFILER
+
+FRAME_MS = 1000 / 60  # One frame of the original 60 FPS loop, the unit all speeds are tuned in
+TICK_RATE = 120  # Fixed logic updates per second
+TICK_MS = 1000 / TICK_RATE
+TICK_DT = TICK_MS / FRAME_MS  # Length of one tick in 60 FPS frames
+MAX_TICKS_PER_FRAME = 30  # Catch-up limit after a hitch, older time is dropped
+
+
+class InputState:
+    """Snapshot of the W/A/S/D keys that can be indexed like pygame.key.get_pressed()"""
+
+    def __init__(self, up=False, left=False, down=False, right=False):
+        self.up = bool(up)
+        self.left = bool(left)
+        self.down = bool(down)
+        self.right = bool(right)
+
+    @classmethod
+    def from_pressed(cls, pressed):
+        return cls(pressed[pygame.K_w], pressed[pygame.K_a], pressed[pygame.K_s], pressed[pygame.K_d])
+
+    @classmethod
+    def from_bits(cls, bits):
+        return cls(bits & 1, bits & 2, bits & 4, bits & 8)
+
+    def to_bits(self):
+        """W/A/S/D packed into the low four bits"""
+        return self.up | (self.left << 1) | (self.down << 2) | (self.right << 3)
+
+    def __getitem__(self, key):
+        if key == pygame.K_w:
+            return self.up
+        if key == pygame.K_a:
+            return self.left
+        if key == pygame.K_s:
+            return self.down
+        if key == pygame.K_d:
+            return self.right
+        return False
+
+
+class Difficulty:
+    """The curves that ramp the game up over a run (elapsed time in seconds)"""
+    OVERCLOCK_MAX_SCROLL_SPEED = 18  # Cap of the overclock tier, safe with swept collision
+
+    def __init__(self, base_scroll_speed=3, scroll_growth=0.01, scroll_exponent=1.4, max_scroll_speed=12,
+                 base_spawn_delay=2000, spawn_delay_growth=5, spawn_delay_exponent=1.2, min_spawn_delay=300,
+                 oscillating_ramp=(40, 80, 120)):
+        self.base_scroll_speed = base_scroll_speed
+        self.scroll_growth = scroll_growth
+        self.scroll_exponent = scroll_exponent
+        self.max_scroll_speed = max_scroll_speed
+        self.base_spawn_delay = base_spawn_delay
+        self.spawn_delay_growth = spawn_delay_growth
+        self.spawn_delay_exponent = spawn_delay_exponent
+        self.min_spawn_delay = min_spawn_delay
+        self.oscillating_ramp = oscillating_ramp
+
+    @classmethod
+    def overclock(cls, **kwargs):
+        """The normal curves with the speed cap raised to the overclock tier"""
+        kwargs.setdefault("max_scroll_speed", cls.OVERCLOCK_MAX_SCROLL_SPEED)
+        return cls(**kwargs)
+
+    def scroll_speed(self, elapsed_time):
+        """Pixels per 60 FPS frame"""
+        return min(self.base_scroll_speed + (elapsed_time ** self.scroll_exponent) * self.scroll_growth,
+                   self.max_scroll_speed)
+
+    def obstacle_spawn_delay(self, elapsed_time):
+        """Milliseconds between obstacle spawns"""
+        return max(self.min_spawn_delay,
+                   self.base_spawn_delay - int((elapsed_time ** self.spawn_delay_exponent) * self.spawn_delay_growth))
+
+    def obstacle_types(self, elapsed_time):
+        """Obstacle type numbers to pick from; each ramp step passed adds another oscillating (3) entry"""
+        available_types = [0, 1, 2]
+        for ramp_time in self.oscillating_ramp:
+            if elapsed_time > ramp_time:
+                available_types.append(3)
+        return available_types
+
+
+class GameSimulation:
+    """The playing state of the game, steppable without a window or a real clock.
+
+    step() advances the game state by one fixed tick of TICK_MS; draw() renders the
+    current state onto any surface. All timers run on simulated milliseconds, so a
+    simulation can be stepped as fast as the CPU allows and several can live in the
+    same process. advance() feeds real frame times through a fixed-rate accumulator
+    so game speed does not depend on the render rate.
+    """
+    LANE_COUNT = 3
+    ROBOT_STARTING_X = 400
+    LANE_COOLDOWN = 150  # milliseconds between switches
+    COIN_SPAWN_DELAY = 1000  # milliseconds between coins
+    KEY_FRAGMENTS_NEEDED = 5
+    SWEEP_MARGIN = 20  # Pixels anything but the scroll can move in one tick (oscillating obstacles, viruses)
+
+    def __init__(self, screen_width=1500, screen_height=600, difficulty=None, invulnerable=False,
+                 entity_store=False, portals=True):
+        self.difficulty = difficulty if difficulty is not None else Difficulty()
+        self.invulnerable = invulnerable  # Count collisions instead of ending the run (batch runs)
+        self.portals = portals  # False never spawns a portal, so a run stays on the obstacle ramps
+
+        # Obstacle, coin and virus positions in NumPy arrays, moved a whole kind at a time
+        if entity_store and not Entities.numpy_available:
+            print("NumPy not found, using plain entity objects")
+            entity_store = False
+        self.entity_store = entity_store
+        self.entities = Entities.StoreEntities() if entity_store else Entities.ObjectEntities()
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.lane_y_positions = [screen_height * 0.1, screen_height * 0.5, screen_height * 0.9]
+
+        # Separate streams so cosmetic effects can never change the level a seed produces
+        self.seed = None
+        self.rng = random.Random()  # Gameplay: obstacles, coins, portals, viruses
+        self.fx_rng = random.Random()  # Cosmetics: particles, glitches, sprite details
+
+        self.robot = Robot(self.ROBOT_STARTING_X, self.lane_y_positions[1], 20, 20, fx_rng=self.fx_rng)
+        self.robot.set_trail_length(round(self.robot.trail_length / TICK_DT))  # Keep the trail's length in time
+        self.portal_system = PortalSystem(screen_width, screen_height, self.rng, self.fx_rng)
+        self.portal_system.entities = self.entities
+        self.particles = ParticlePool()  # Obstacle flames and virus trails, under one budget
+        self.portal_system.particles = self.particles
+
+        # Background is optional so headless runs never need an image
+        self.background = None
+        self.bg_width = screen_width
+        self.tiles = 1
+
+        # Stage timings for the F3 overlay, Main swaps in a FrameProfiler
+        self.profiler = NULL_PROFILER
+
+        self.reset()
+
+    def set_background(self, image):
+        bg_width = image.get_width()
+        self.background = pygame.transform.scale(image, (bg_width, self.screen_height))
+        self.bg_width = bg_width
+        self.tiles = math.ceil(self.screen_width / bg_width) + 1
+
+    def reset(self, seed=None):
+        """Start a fresh run, reproducible from its seed (a random one if none is given)"""
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.seed = seed
+        self.rng.seed(seed)
+        self.fx_rng.seed(seed ^ 0x5EED5EED)
+
+        self.portal_system.end_effect()
+        self.robot.reset(self.ROBOT_STARTING_X, self.lane_y_positions[1])
+
+        # Both scroll left together, so they live in x-sorted indexes with O(1) eviction
+        self.entities.clear()
+        self.particles.clear()
+        self.obstacles = ScrollingIndex(lambda obstacle: obstacle.get_rects(), self.entities.release)
+        self.coins = ScrollingIndex(released=self.entities.release)
+
+        # Simulated clock (ms since the run started)
+        self.current_time = 0
+        self.elapsed_time = 0
+        self.tick_count = 0
+        self.accumulator = 0
+        self.alpha = 1.0  # Interpolation factor between the last two ticks
+
+        self.scroll = 0
+        self.prev_scroll = 0
+        self.scroll_speed = 3
+
+        self.obstacle_timer = 0
+        self.obstacle_spawn_delay = 2000  # milliseconds
+        self.coin_spawn_timer = 0
+        self.key_spawn_timer = 0
+        self.glitch_spawn_timer = 0
+        self.glitch_coin_pattern_angle = 0
+        self.key_fragments_collected = 0
+
+        self.robot_lane = 1  # Middle lane
+        self.last_lane_switch = -self.LANE_COOLDOWN
+
+        self.score = 0
+        self.game_over = False
+        self.events = []
+
+        # Counters for offline analysis of spawning and difficulty
+        self.collision_ticks = 0
+        self.obstacle_spawn_attempts = 0
+        self.obstacle_spawn_rejections = 0
+        self.coin_spawn_attempts = 0
+        self.coin_spawn_rejections = 0
+
+        # Every tick's input, so the run can be replayed from its seed
+        self.recorder = InputRecorder()
+
+    # === Simulation ===
+
+    def advance(self, frame_ms, keys=None, input_source=None):
+        """Run as many fixed ticks as frame_ms covers and return their events
+
+        Ticks use keys, or read the next recorded W/A/S/D bitmask from
+        input_source.next_bits() each tick when one is given (replays).
+        """
+        events = []
+        self.accumulator += frame_ms
+        ticks = 0
+        while self.accumulator >= TICK_MS and not self.game_over:
+            if input_source is not None:
+                if input_source.finished:
+                    break
+                keys = InputState.from_bits(input_source.next_bits())
+            events.extend(self.step(keys))
+            self.accumulator -= TICK_MS
+            ticks += 1
+            if ticks >= MAX_TICKS_PER_FRAME:
+                self.accumulator = 0
+                break
+
+        self.alpha = 1.0 if self.game_over else self.accumulator / TICK_MS
+        return events
+
+    def step(self, keys):
+        """Advance the run by one fixed tick and return the events raised during it"""
+        self.events = []
+        if self.game_over:
+            return self.events
+
+        if not isinstance(keys, InputState):
+            keys = InputState.from_pressed(keys)
+        self.recorder.record(keys.to_bits())
+
+        # The tick count is the clock, summing TICK_MS every tick would drift off by float error
+        self.tick_count += 1
+        self.current_time = self.tick_count * 1000 / TICK_RATE
+        self.elapsed_time = self.tick_count / TICK_RATE  # seconds
+
+        robot = self.robot
+        robot.store_previous_position()
+        robot_x_coord = robot.get_x_coord()
+        robot_y_coord = robot.get_y_coord()
+
+        # Speeds are in pixels per 60 FPS frame, scaled by TICK_DT per tick
+        self.scroll_speed = self.difficulty.scroll_speed(self.elapsed_time)
+        self.prev_scroll = self.scroll
+        self.scroll -= self.scroll_speed * TICK_DT
+        if abs(self.scroll) > self.bg_width:
+            self.scroll = 0
+
+        self._handle_input(keys)
+
+        # Continuous updates
+        robot.update_dash(TICK_DT)
+        robot.update_trail_for_scroll(self.scroll_speed * TICK_DT)
+        robot.add_trail_position()
+
+        # Screen boundary checks
+        if robot_x_coord < 0:
+            robot.set_x_coord(0)
+        if robot_x_coord + robot.get_width() > self.screen_width:
+            robot.set_x_coord(self.screen_width - robot.get_width())
+        if robot_y_coord < 0:
+            robot.set_y_coord(0)
+        if robot_y_coord > self.screen_height:
+            robot.set_y_coord(self.screen_height - robot.get_width())
+
+        profiler = self.profiler
+        robot_rect = pygame.Rect(robot_x_coord, robot_y_coord, robot.get_width(), robot.get_height())
+
+        # Obstacles and viruses are hit along the whole move of this tick, not just where it ended
+        end_rect = pygame.Rect(robot.get_x_coord(), robot.get_y_coord(), robot.get_width(), robot.get_height())
+        sweep = (end_rect, end_rect.x - robot_x_coord, end_rect.y - robot_y_coord)
+
+        with profiler.stage("particle update"):
+            self.particles.update(self.scroll_speed, TICK_DT)
+
+        with profiler.stage("obstacle update"):
+            if not self.portal_system.active:
+                if self.portals:
+                    self.portal_system.try_spawn_portal(TICK_DT)
+                self._spawn_obstacles()
+            self._update_obstacles(sweep)
+
+        with profiler.stage("portal update"):
+            self._check_portals(robot_rect)
+            self.portal_system.update(robot_x_coord, robot_y_coord, self.scroll_speed, self.current_time, TICK_DT)
+            self._check_viruses(sweep)
+
+        with profiler.stage("coin spawn"):
+            if self.portal_system.player_inside:
+                self._spawn_portal_collectibles()
+            else:
+                self._spawn_coin()
+        with profiler.stage("coin update"):
+            self._update_coins(robot_rect)
+
+        return self.events
+
+    def _handle_input(self, keys):
+        robot = self.robot
+        current_time = self.current_time
+
+        if self.portal_system.active:
+            speed = robot.get_speed() * TICK_DT
+            if keys[pygame.K_w]:
+                robot.move(0, -speed)
+            if keys[pygame.K_a]:
+                robot.move(-speed, 0)
+            if keys[pygame.K_s]:
+                robot.move(0, speed)
+            if keys[pygame.K_d]:
+                robot.move(speed, 0)
+            return
+
+        can_switch = current_time - self.last_lane_switch > self.LANE_COOLDOWN and not robot.dashing
+        if keys[pygame.K_w] and self.robot_lane > 0 and can_switch:
+            self._switch_lane(self.robot_lane - 1)
+            can_switch = False
+        if keys[pygame.K_s] and self.robot_lane < self.LANE_COUNT - 1 and can_switch:
+            self._switch_lane(self.robot_lane + 1)
+
+        if keys[pygame.K_d]:
+            if robot.try_dash("right", self.screen_width, current_time):
+                self.events.append("zap")
+        elif keys[pygame.K_a]:
+            if robot.try_dash("left", self.screen_width, current_time):
+                self.events.append("zap")
+
+    def _switch_lane(self, new_lane):
+        robot = self.robot
+        old_center = (robot.get_x_coord() + robot.get_width() // 2, robot.get_y_coord() + robot.get_height() // 2)
+        dy = self.lane_y_positions[new_lane] - robot.get_y_coord()
+        robot.move(0, dy)
+        robot.store_previous_position()  # Lane switches teleport, don't interpolate them
+        new_center = (robot.get_x_coord() + robot.get_width() // 2, robot.get_y_coord() + robot.get_height() // 2)
+        robot.add_trail_segment(old_center, new_center)
+        self.robot_lane = new_lane
+        self.last_lane_switch = self.current_time
+        robot.start_glitch(self.current_time)
+        self.events.append("zap")
+
+    def _spawn_obstacles(self):
+        elapsed_time = self.elapsed_time
+        self.obstacle_spawn_delay = self.difficulty.obstacle_spawn_delay(elapsed_time)
+        if self.current_time - self.obstacle_timer <= self.obstacle_spawn_delay:
+            return
+
+        # Rejected spawns retry every tick until the way is clear
+        self.obstacle_spawn_attempts += 1
+        can_spawn = True
+        last_obstacle = self.obstacles.last()
+        if last_obstacle is not None:
+            if last_obstacle.get_x_coord() > self.screen_width - 150:
+                can_spawn = False
+
+            last_type = last_obstacle.get_type() if hasattr(last_obstacle, 'get_type') else None
+
+            next_type_num = self.rng.choice(self.difficulty.obstacle_types(elapsed_time))
+            next_type = (
+                "top" if next_type_num == 0 else
+                "bottom" if next_type_num == 1 else
+                "floating" if next_type_num == 2 else
+                "oscillating"
+            )
+
+            # Prevent top-bottom direct succession
+            if (last_type == "top" and next_type == "bottom") or (last_type == "bottom" and next_type == "top"):
+                can_spawn = False
+        else:
+            # First spawn: choose among the basic types
+            next_type_num = self.rng.choice([0, 1, 2])
+
+        if not can_spawn:
+            self.obstacle_spawn_rejections += 1
+            return
+
+        self.obstacle_timer = self.current_time
+        if self.rng.random() < 0.65:
+            # Spawn single obstacle
+            if next_type_num == 3:
+                self.obstacles.add(self.entities.MovingObstacle(self.screen_width, self.screen_height,
+                                                                self.rng, self.fx_rng, self.particles))
+            else:
+                self.obstacles.add(self.entities.Obstacle(self.screen_width, self.screen_height, next_type_num,
+                                                          self.rng, self.fx_rng, self.particles))
+        else:
+            # Spawn paired obstacle
+            self.obstacles.add(self.entities.PairedObstacle(self.screen_width, self.screen_height,
+                                                            self.lane_y_positions, self.rng, self.fx_rng, self.particles))
+
+    def _sweep_bounds(self, sweep):
+        """A rect containing everything the robot can have touched during the tick"""
+        end_rect, dx, dy = sweep
+        reach = math.ceil(self.scroll_speed * TICK_DT) + self.SWEEP_MARGIN
+        return end_rect.union(end_rect.move(-dx, -dy)).inflate(2 * reach, 2 * reach)
+
+    def _sweep_hits(self, sweep, rects, motion):
+        end_rect, dx, dy = sweep
+        motion_x, motion_y = motion
+        return any(swept_collide(end_rect, dx, dy, rect, motion_x, motion_y) for rect in rects)
+
+    def _update_obstacles(self, sweep):
+        self.entities.move_obstacles(self.scroll_speed, TICK_DT)
+        for obstacle in self.obstacles:
+            obstacle.update(self.scroll_speed, TICK_DT)
+        self.obstacles.scroll(self.scroll_speed * TICK_DT)
+
+        for obstacle in self.obstacles.query(self._sweep_bounds(sweep)):
+            if self._sweep_hits(sweep, obstacle.get_rects(), obstacle.get_motion()):
+                self._end_run()
+
+        self.obstacles.evict_front(lambda obstacle: obstacle.is_off_screen())
+
+    def _check_portals(self, robot_rect):
+        portal_system = self.portal_system
+
+        entry_rect = portal_system.get_entry_portal_rect()
+        if entry_rect and robot_rect.colliderect(entry_rect):
+            portal_system.activate(self.robot, self.obstacles, self.current_time)
+            self.events.append("portal")
+
+        exit_rect = portal_system.get_exit_portal_rect()
+        if exit_rect and robot_rect.colliderect(exit_rect):
+            portal_system.end_effect()
+            self.robot.set_y_coord(self.lane_y_positions[1])
+            self.robot.store_previous_position()
+            self.robot_lane = 1
+            self.last_lane_switch = self.current_time
+            self.key_fragments_collected = 0
+            self.glitch_coin_pattern_angle = 0
+            self.key_spawn_timer = 0
+            self.glitch_spawn_timer = 0
+            self.events.append("portal")
+
+    def _check_viruses(self, sweep):
+        for virus in self.portal_system.get_viruses_hitting(self._sweep_bounds(sweep)):
+            if self._sweep_hits(sweep, (virus.get_rect(),), virus.get_motion()):
+                self._end_run()
+
+    def _spawn_coin(self):
+        current_time = self.current_time
+        if current_time - self.coin_spawn_timer <= self.COIN_SPAWN_DELAY:
+            return
+        self.coin_spawn_timer = current_time
+
+        potential_coin_x = self.screen_width + self.rng.randint(0, 50)
+        potential_coin_y = self.rng.choice(self.lane_y_positions)
+        value = Coin.roll_value(self.rng)  # Rolled before the check so rejected spawns use the same randomness
+        self.coin_spawn_attempts += 1
+
+        if self.obstacles.query(Coin.rect_at(potential_coin_x, potential_coin_y)):
+            self.coin_spawn_rejections += 1
+            return
+
+        self.coins.add(self.entities.Coin(potential_coin_x, potential_coin_y, current_time,
+                                          self.rng, self.fx_rng, value))
+
+    def _spawn_portal_collectibles(self):
+        current_time = self.current_time
+
+        # Spawn key fragments
+        if (self.key_fragments_collected < self.KEY_FRAGMENTS_NEEDED and
+                current_time - self.key_spawn_timer > KeyCollectible.SPAWN_DELAY):
+            self.key_spawn_timer = current_time
+            key_x = self.screen_width + self.rng.randint(0, 100)
+            key_y = self.rng.randint(100, self.screen_height - 100)
+
+            if KeyCollectible.can_spawn(key_x, key_y, self.obstacles):
+                self.coins.add(KeyCollectible(key_x, key_y, current_time))
+
+        # Spawn glitch pattern
+        if current_time - self.glitch_spawn_timer > GlitchCollectible.SPAWN_DELAY:
+            self.glitch_spawn_timer = current_time
+
+            glitch_center_x = self.screen_width + 100
+            glitch_center_y = self.screen_height // 2
+
+            if GlitchCollectible.can_spawn_pattern(glitch_center_x, glitch_center_y, self.obstacles):
+                for i in range(GlitchCollectible.PATTERN_COUNT):
+                    angle = self.glitch_coin_pattern_angle + i * (360 / GlitchCollectible.PATTERN_COUNT)
+                    rad = math.radians(angle)
+                    gx = glitch_center_x + GlitchCollectible.PATTERN_RADIUS * math.cos(rad)
+                    gy = glitch_center_y + GlitchCollectible.PATTERN_RADIUS * math.sin(rad)
+                    self.coins.add(GlitchCollectible(gx, gy, current_time, self.fx_rng))
+
+                self.glitch_coin_pattern_angle = (self.glitch_coin_pattern_angle + 15) % 360
+
+    def _update_coins(self, robot_rect):
+        self.entities.move_coins(self.scroll_speed, TICK_DT)
+        for coin in self.coins:
+            if isinstance(coin, KeyCollectible):
+                coin.update(self.scroll_speed, TICK_DT)
+            else:
+                coin.update(self.scroll_speed, self.current_time, TICK_DT)
+        self.coins.scroll(self.scroll_speed * TICK_DT)
+
+        for coin in self.coins.query(robot_rect):
+            if coin.collected:
+                continue
+            self.score += coin.collect()
+            self.events.append("collect:" + coin.type)
+            self.coins.remove(coin)
+
+            if coin.type == "KEY":
+                self.key_fragments_collected += 1
+                if self.key_fragments_collected >= self.KEY_FRAGMENTS_NEEDED:
+                    self.portal_system.spawn_exit_portal()
+
+        self.coins.evict_front(lambda coin: coin.x < -coin.size)
+
+    def _end_run(self):
+        if self.invulnerable:
+            self.collision_ticks += 1
+        elif not self.game_over:
+            self.game_over = True
+            self.events.append("game_over")
+
+    # === Rendering ===
+
+    def draw(self, screen):
+        """Draw the current state of the run (everything except the HUD)
+
+        Moving things are drawn between their last two tick positions using self.alpha.
+        """
+        alpha = self.alpha
+        profiler = self.profiler
+
+        with profiler.stage("background"):
+            if self.background is not None:
+                scroll = self.scroll
+                if self.scroll < self.prev_scroll:  # Skip interpolation across the wrap-around
+                    scroll = self.prev_scroll + (self.scroll - self.prev_scroll) * alpha
+                for i in range(0, self.tiles):
+                    screen.blit(self.background, (i * self.bg_width + scroll, 0))
+            else:
+                screen.fill((0, 0, 0))
+
+            if not self.portal_system.active:
+                # Draw lane lines
+                for lane_y in self.lane_y_positions:
+                    pygame.draw.line(screen, (105, 105, 105), (0, lane_y + 10), (self.screen_width, lane_y + 10), 1)
+
+        with profiler.stage("robot draw"):
+            self.robot.draw(screen, self.current_time, alpha)
+
+        with profiler.stage("obstacle draw"):
+            for obstacle in self.obstacles:
+                obstacle.draw(screen, alpha)
+
+        with profiler.stage("particle draw"):
+            self.particles.draw(screen, self.fx_rng)
+
+        with profiler.stage("portal draw"):
+            self.portal_system.draw(screen, alpha)
+
+        with profiler.stage("coin draw"):
+            player_inside = self.portal_system.player_inside
+            for coin in self.coins:
+                if (player_inside and coin.type not in ["DATA", "CRYPTO", "BITCOIN"]) or \
+                        (not player_inside and coin.type not in ["KEY", "GLITCH"]):
+                    coin.draw(screen, alpha)
+
+    def get_entity_counts(self):
+        """Live entities and particles, for the profiler overlay"""
+        viruses = self.portal_system.get_viruses()
+        particles = len(self.particles) + len(self.robot.active_particles)
+        return {
+            "obstacles": len(self.obstacles),
+            "coins": len(self.coins),
+            "viruses": len(viruses),
+            "particles": particles,
+            "trail": len(self.robot.trail_positions),
+        }
+
+
+if __name__ == "__main__":
+    # Headless throughput check: python Simulation.py [ticks] [instances]
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    instances = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    inputs = [InputState(*(random.random() < 0.05 for _ in range(4))) for _ in range(256)]
+    simulations = [GameSimulation() for _ in range(instances)]
+    runs = 0
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        for simulation in simulations:
+            simulation.step(inputs[tick % len(inputs)])
+            if simulation.game_over:
+                simulation.reset()
+                runs += 1
+    duration = time.perf_counter() - start
+
+    total_ticks = ticks * instances
+    print(f"{total_ticks} ticks over {instances} simulations in {duration:.2f}s "
+          f"({total_ticks / duration:.0f} ticks/s, {runs} runs ended)")
@@ -0,0 +1,5 @@
+"""Timing suite for the rendering and update hot paths.
+
+Run with ``python -m benchmarks`` from the project folder. Everything draws
+onto an offscreen display (SDL dummy video driver), so no window opens.
+"""
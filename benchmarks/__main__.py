@@ -0,0 +1,45 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import pygame
+from benchmarks import harness
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Time the rendering and update hot paths")
+    parser.add_argument("pattern", nargs="?", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=7, help="timed repeats per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds each repeat should last at least")
+    parser.add_argument("--baseline", default="local", help="baseline name to compare against / save to")
+    parser.add_argument("--save", action="store_true", help="save the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.05, help="relative change worth flagging")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1500, 600))
+    from benchmarks import cases  # Needs the display for convert_alpha() and fonts
+
+    baseline = harness.load_baseline(args.baseline) or {}
+    print(f"{'benchmark':<32}{'median':>12}{'min':>12}{'spread':>9}  vs {args.baseline}")
+
+    def report(name, result):
+        line = (f"{name:<32}{result['median'] * 1e6:>10.1f}us{result['min'] * 1e6:>10.1f}us"
+                f"{result['spread'] * 100:>8.1f}%")
+        if name in baseline:
+            change, significant = harness.compare(result, baseline[name], args.threshold)
+            verdict = ("slower" if change > 0 else "faster") if significant else "~"
+            line += f"  {change * 100:+6.1f}% {verdict}"
+        print(line, flush=True)
+
+    results = harness.run(args.pattern, args.repeat, args.min_time, report)
+
+    if args.save:
+        # Keep entries that were filtered out of this run
+        harness.save_baseline({**baseline, **results}, args.baseline)
+        print(f"Saved baseline '{args.baseline}' to {harness.baseline_path(args.baseline)}")
+
+
+main()
@@ -0,0 +1,277 @@
+import os
+import random
+import pygame
+from benchmarks.harness import benchmark
+from Obstacle import Obstacle, PairedObstacle
+from Particles import ParticlePool
+from Coin import Coin, KeyCollectible, GlitchCollectible
+from Customisations import skins, trails
+from Menus import MainMenu, GameOverMenu, Shop
+from Manager import DataManager
+from Robot import Robot
+from Hud import HackerHud
+from Assets import resource_path
+from Fonts import fonts
+from Simulation import GameSimulation, InputState, FRAME_MS
+import Entities
+
+SCREEN_WIDTH = 1500
+SCREEN_HEIGHT = 600
+LANE_Y_POSITIONS = [SCREEN_HEIGHT * 0.1, SCREEN_HEIGHT * 0.5, SCREEN_HEIGHT * 0.9]
+
+# Elapsed seconds the scripted full frames are measured at, with portals off so every point is the obstacle game
+FRAME_POINTS = [0, 30, 60, 120, 180]
+MIN_FRAME_OBSTACLES = 3  # Fewer at a point past the start means it isn't measuring the obstacle ramps
+
+
+def _screen():
+    return pygame.display.get_surface()
+
+
+def _flaming_pool(obstacles=12, updates=60):
+    # Run a screenful of obstacles long enough to fill the pool with their flame particles
+    pool = ParticlePool()
+    rng = random.Random(2)
+    burning = [Obstacle(100 * i, SCREEN_HEIGHT, None, rng, rng, pool) for i in range(obstacles)]
+    for _ in range(updates):
+        pool.update(0)
+        for obstacle in burning:
+            obstacle.update(0)
+    return pool
+
+
+# === Micro benchmarks ===
+
+@benchmark("Obstacle.draw")
+def obstacle_draw():
+    screen = _screen()
+    obstacle = Obstacle(SCREEN_WIDTH // 2, SCREEN_HEIGHT, 0, random.Random(1), random.Random(2))
+    return lambda: obstacle.draw(screen)
+
+
+@benchmark("PairedObstacle.draw")
+def paired_obstacle_draw():
+    screen = _screen()
+    obstacle = PairedObstacle(SCREEN_WIDTH // 2, SCREEN_HEIGHT, LANE_Y_POSITIONS, random.Random(1), random.Random(2))
+    return lambda: obstacle.draw(screen)
+
+
+@benchmark("ParticlePool.update")
+def particle_update():
+    pool = _flaming_pool()
+    lives = list(pool.life[:pool.count])
+
+    def update():
+        # Restore the lives so every call updates the same particles
+        pool.count = len(lives)
+        pool.life[:pool.count] = lives
+        pool.update(3, 0.5)
+    return update
+
+
+@benchmark("ParticlePool.draw")
+def particle_draw():
+    screen = _screen()
+    pool = _flaming_pool()
+    fx_rng = random.Random(2)
+    return lambda: pool.draw(screen, fx_rng)
+
+
+@benchmark("Coin.__init__")
+def coin_init():
+    rng = random.Random(3)
+    Coin.build_atlas()
+    # A spawn attempt of each type
+    return lambda: [Coin(0, 0, 0, rng, rng, value) for value in (20, 50, 100)]
+
+
+@benchmark("portal collectible spawn")
+def portal_spawn():
+    rng = random.Random(3)
+    KeyCollectible.build_frames()
+    GlitchCollectible.build_frames()
+    # A key and a full glitch ring, the burst virus mode spawns
+    return lambda: ([KeyCollectible(0, 0, 0)] +
+                    [GlitchCollectible(0, 0, 0, rng) for _ in range(GlitchCollectible.PATTERN_COUNT)])
+
+
+@benchmark("Coin.draw[CRYPTO]")
+def coin_draw():
+    screen = _screen()
+    rng = random.Random(3)
+    coin = Coin(400, 300, 0, rng, rng, 50)
+    Coin.build_atlas()
+
+    def draw():
+        coin.update(0, 0, 0.5)  # Run through the glow's pulse sizes
+        coin.draw(screen)
+    return draw
+
+
+for _skin in skins:
+    def _skin_setup(skin=_skin):
+        screen = _screen()
+        rect = pygame.Rect(400, 300, 20, 20)
+        return lambda: skin.draw_robot(screen, rect, skin)
+    benchmark(f"Skin.draw_robot[{_skin.name}]")(_skin_setup)
+
+
+@benchmark("MainMenu.draw_matrix_rain")
+def matrix_rain():
+    random.seed(4)
+    menu = MainMenu(_screen(), SCREEN_WIDTH, SCREEN_HEIGHT)
+    for _ in range(600):  # Let the drops fall onto the screen
+        menu.update_matrix_rain()
+    return menu.draw_matrix_rain
+
+
+@benchmark("MainMenu.draw")
+def main_menu_draw():
+    random.seed(4)
+    menu = MainMenu(_screen(), SCREEN_WIDTH, SCREEN_HEIGHT)
+    menu.set_total_score(12000)
+    return menu.draw
+
+
+@benchmark("GameOverMenu.draw")
+def game_over_draw():
+    menu = GameOverMenu(_screen(), SCREEN_WIDTH, SCREEN_HEIGHT)
+    menu.set_stats(97, 340, 12000, 1234)
+
+    def draw():
+        # Main sets the same stats every frame
+        menu.set_stats(97, 340, 12000, 1234)
+        menu.draw()
+    return draw
+
+
+@benchmark("Shop.draw")
+def shop_draw():
+    shop = Shop(_screen(), SCREEN_WIDTH, SCREEN_HEIGHT, DataManager(), skins, trails)
+    return shop.draw
+
+
+@benchmark("HackerHud.draw")
+def hacker_ui():
+    screen = _screen()
+    hud = HackerHud(fonts.get(30))
+    ticks = [0]
+
+    def draw():
+        # A new second every 60 frames, like the game
+        ticks[0] += 1
+        hud.draw(screen, ticks[0] / 60, 12000, 340, 150, 0, False)
+    return draw
+
+
+@benchmark("HackerHud.draw[portal]")
+def hacker_ui_portal():
+    screen = _screen()
+    hud = HackerHud(fonts.get(30))
+    ticks = [0]
+
+    def draw():
+        ticks[0] += 1
+        hud.draw(screen, ticks[0] / 60, 12000, 340, 150, 3, True)
+    return draw
+
+
+@benchmark("Robot.add_trail_position")
+def trail_position():
+    robot = Robot(400, 300, 20, 20, fx_rng=random.Random(5))
+    robot.set_trail("Fire")
+    steps = [0]
+
+    def add_trail_position():
+        # Scroll like the game does and wobble up and down so every branch is taken
+        steps[0] += 1
+        robot.move(0, 8 if steps[0] % 20 < 10 else -8)
+        robot.update_trail_for_scroll(3)
+        robot.add_trail_position()
+    return add_trail_position
+
+
+@benchmark("Robot.draw[Fire trail]")
+def robot_draw():
+    screen = _screen()
+    robot = Robot(400, 300, 20, 20, fx_rng=random.Random(5))
+    robot.set_trail("Fire")
+    for step in range(120):  # Fill the trail and its particles
+        robot.move(0, 8 if step % 20 < 10 else -8)
+        robot.update_trail_for_scroll(3)
+        robot.add_trail_position()
+    return lambda: robot.draw(screen, 0)
+
+
+# === Full frames ===
+
+# Input script for the frame benchmarks, one W/A/S/D bitmask per 60 ticks, cycled
+FRAME_SCRIPT = [0, 4, 0, 8, 1, 0, 2, 0, 4, 1]
+
+
+def _frame_setup(elapsed_seconds, virus_mode=False):
+    screen = _screen()
+    hud = HackerHud(fonts.get(30))
+    simulation = GameSimulation(SCREEN_WIDTH, SCREEN_HEIGHT, invulnerable=True, portals=virus_mode)
+    simulation.set_background(pygame.image.load(resource_path(os.path.join("background", "hack.webp"))))
+    simulation.robot.set_skin("Matrix")
+    simulation.robot.set_trail("Fire")
+    simulation.reset(1234)
+
+    def keys():
+        return InputState.from_bits(FRAME_SCRIPT[(simulation.tick_count // 60) % len(FRAME_SCRIPT)])
+
+    while simulation.elapsed_time < elapsed_seconds or (virus_mode and not simulation.portal_system.active):
+        simulation.step(keys())
+    if virus_mode:
+        assert simulation.portal_system.active, "virus mode frame outside portal mode"
+    elif elapsed_seconds:
+        assert len(simulation.obstacles) >= MIN_FRAME_OBSTACLES, \
+            f"only {len(simulation.obstacles)} obstacles at {elapsed_seconds}s"
+
+    def frame():
+        # Everything the playing branch of Main.py does in one 60 FPS frame, minus the flip
+        simulation.advance(FRAME_MS, keys())
+        simulation.draw(screen)
+        hud.draw(screen, simulation.elapsed_time, 12000, simulation.score, 150,
+                 simulation.key_fragments_collected, simulation.portal_system.active)
+    return frame
+
+
+for _point in FRAME_POINTS:
+    benchmark(f"frame[{_point}s]", group="frame")(lambda point=_point: _frame_setup(point))
+benchmark("frame[virus mode]", group="frame")(lambda: _frame_setup(0, virus_mode=True))
+
+
+# === Entity store ===
+
+def _many_obstacles(entities, count=300):
+    rng = random.Random(6)
+    obstacles = []
+    for i in range(count):
+        if i % 3 == 0:
+            obstacle = entities.MovingObstacle(SCREEN_WIDTH, SCREEN_HEIGHT, rng, rng)
+        else:
+            obstacle = entities.Obstacle(SCREEN_WIDTH, SCREEN_HEIGHT, None, rng, rng)
+        obstacles.append(obstacle)
+
+    def move_objects():
+        for obstacle in obstacles:
+            obstacle._move(3, 0.5)
+
+    def move_store():
+        entities.move_obstacles(3, 0.5)
+
+    # Only the positions, the part the store vectorizes
+    return move_store if isinstance(entities, Entities.StoreEntities) else move_objects
+
+
+@benchmark("obstacles._move[300 objects]")
+def move_objects():
+    return _many_obstacles(Entities.ObjectEntities())
+
+
+if Entities.numpy_available:
+    @benchmark("obstacles._move[300 store]")
+    def move_store():
+        return _many_obstacles(Entities.StoreEntities())
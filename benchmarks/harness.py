@@ -0,0 +1,95 @@
+import gc
+import json
+import os
+import statistics
+import time
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# (name, group, setup) in registration order, setup returns the function to time
+BENCHMARKS = []
+
+
+def benchmark(name, group="micro"):
+    """Register a setup function; whatever it returns is called in the timed loop"""
+    def register(setup):
+        BENCHMARKS.append((name, group, setup))
+        return setup
+    return register
+
+
+def time_function(function, repeat=7, min_time=0.05):
+    """Time one call of function, like timeit: calibrate a loop count, then repeat it.
+
+    Returns per-call seconds: median, min, stdev and the relative spread (stdev / median).
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        if time.perf_counter() - start >= min_time:
+            break
+        number *= 2
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            timings.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    median = statistics.median(timings)
+    stdev = statistics.stdev(timings) if len(timings) > 1 else 0
+    return {
+        "median": median,
+        "min": min(timings),
+        "stdev": stdev,
+        "spread": stdev / median if median else 0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(pattern=None, repeat=7, min_time=0.05, report=print):
+    """Run every registered benchmark whose name contains pattern"""
+    results = {}
+    for name, group, setup in BENCHMARKS:
+        if pattern and pattern not in name:
+            continue
+        result = time_function(setup(), repeat, min_time)
+        result["group"] = group
+        results[name] = result
+        report(name, result)
+    return results
+
+
+def baseline_path(name):
+    return os.path.join(BASELINE_DIR, name + ".json")
+
+
+def save_baseline(results, name):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    with open(baseline_path(name), "w") as file:
+        json.dump(results, file, indent=4)
+
+
+def load_baseline(name):
+    path = baseline_path(name)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def compare(result, base, threshold=0.05):
+    """Relative change of the median against a baseline entry, and whether it is beyond noise"""
+    change = (result["median"] - base["median"]) / base["median"]
+    noise = 2 * max(result["spread"], base["spread"])
+    return change, abs(change) > max(threshold, noise)